@@ -1,4 +1,5 @@
 import dataclasses
+import sys
 import typing as t
 
 from src.internals.callables import LoxCallable
@@ -7,9 +8,18 @@ if t.TYPE_CHECKING:
     from src.interpreter.interpreter import Interpreter
 
 
+BUILT_INS: dict[str, "BuiltInCallable"] = {}
+
+
 @dataclasses.dataclass
 class BuiltInCallable(LoxCallable):
-    _short_name: str = "built-in"
+    _short_name: t.ClassVar[str] = "built-in"
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        """Register a singleton of each concrete builtin under its short name."""
+        super().__init_subclass__(**kwargs)
+        cls._short_name = sys.intern(cls._short_name)
+        BUILT_INS[cls._short_name] = cls()
 
     def __str__(self) -> str:
         return f"<Built-in function '{self._short_name}'>"
@@ -20,3 +30,6 @@ class BuiltInCallable(LoxCallable):
     @property
     def arity(self) -> int:
         raise NotImplementedError
+
+
+from . import generic, io, maths  # noqa: E402, F401  (imported for the registration side effect)
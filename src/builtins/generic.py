@@ -1,92 +1,78 @@
-import dataclasses
 import time
 import typing as t
 
 from src.exceptions import PyLoxTypeError
 from src.internals.array import LoxArray
 from src.internals.hash import LoxHash
-from src.internals.http import LoxRequest
 from src.internals.string import LoxString
 
 from . import BuiltInCallable
 
 if t.TYPE_CHECKING:
+    from src.internals.http import LoxRequest
     from src.interpreter.interpreter import Interpreter
 
 
 NUMERIC = t.Union[int, float]
 
 
-@dataclasses.dataclass
 class Array(BuiltInCallable):
+    __slots__ = ()
     _short_name = "array"
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxArray:
         return LoxArray()
 
-    @property
-    def arity(self) -> int:
-        return 0
 
-
-@dataclasses.dataclass
 class Clock(BuiltInCallable):
+    __slots__ = ()
     _short_name = "clock"
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> float:
-        return time.time()
-
-    @property
-    def arity(self) -> int:
-        return 0
+        return time.monotonic_ns() / 1e9
 
 
-@dataclasses.dataclass
 class Length(BuiltInCallable):
+    __slots__ = ()
     _short_name = "len"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> int:
+        argument = arguments[0]
+        if type(argument) is LoxArray or type(argument) is LoxString:
+            return len(argument.fields)
         try:
-            return len(arguments[0])
+            return len(argument)
         except TypeError:
             raise PyLoxTypeError("Argument must be a string or an array.")
 
 
-@dataclasses.dataclass
 class Max(BuiltInCallable):
+    __slots__ = ()
     _short_name = "max"
-
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> NUMERIC:
-        return max(arguments)
+        first, second = arguments
+        return first if first > second else second
 
 
-@dataclasses.dataclass
 class Min(BuiltInCallable):
+    __slots__ = ()
     _short_name = "min"
-
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> NUMERIC:
-        return min(arguments)
+        first, second = arguments
+        return first if first < second else second
 
 
-@dataclasses.dataclass
 class Ord(BuiltInCallable):
+    __slots__ = ()
     _short_name = "ord"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[str], /) -> int:
         try:
@@ -95,85 +81,78 @@ class Ord(BuiltInCallable):
             raise PyLoxTypeError("Argument must be a string.")
 
 
-@dataclasses.dataclass
 class Str(BuiltInCallable):
+    __slots__ = ()
     _short_name = "str"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxString:
+        argument = arguments[0]
+        if type(argument) is str:
+            return LoxString(argument)
         try:
-            return LoxString(arguments[0])
+            return LoxString(argument)
         except TypeError:
             raise PyLoxTypeError("Argument must be a string or an array.")
 
 
-@dataclasses.dataclass
 class Int(BuiltInCallable):
+    __slots__ = ()
     _short_name = "int"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> int:
+        argument = arguments[0]
+        if type(argument) is int:
+            return argument
         try:
-            return int(arguments[0])
+            return int(argument)
         except TypeError:
             raise PyLoxTypeError("Argument must be a string or an array.")
 
 
-@dataclasses.dataclass
 class Float(BuiltInCallable):
+    __slots__ = ()
     _short_name = "float"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> float:
+        argument = arguments[0]
+        if type(argument) is float:
+            return argument
         try:
-            return float(arguments[0])
+            return float(argument)
         except TypeError:
             raise PyLoxTypeError("Argument must be a string or an array.")
 
 
-@dataclasses.dataclass
 class Type(BuiltInCallable):
+    __slots__ = ()
     _short_name = "type"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> str:
         return type(arguments[0]).__name__
 
 
-@dataclasses.dataclass
 class Request(BuiltInCallable):
+    __slots__ = ()
     _short_name = "requests"
     _setup = True
-
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(
         self, interpreter: t.Optional["Interpreter"] = None, arguments: t.Optional[list[str]] = None, /
-    ) -> LoxRequest:
+    ) -> "LoxRequest":
+        from src.internals.http import LoxRequest
+
         return LoxRequest()
 
 
-@dataclasses.dataclass
 class Hash(BuiltInCallable):
+    __slots__ = ()
     _short_name = "hash"
-
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxHash:
         return LoxHash()
@@ -1,4 +1,4 @@
-import dataclasses
+import pathlib
 import typing as t
 
 from src.exceptions import PyLoxFileNotFoundError
@@ -11,57 +11,44 @@ if t.TYPE_CHECKING:
     from src.interpreter.interpreter import Interpreter
 
 
-@dataclasses.dataclass
 class Input(BuiltInCallable):
+    __slots__ = ()
     _short_name = "input"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[LoxString], /) -> LoxString:
         return LoxString(input(str(arguments[0])))
 
 
-@dataclasses.dataclass
 class Read(BuiltInCallable):
+    __slots__ = ()
     _short_name = "read"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[LoxString], /) -> LoxString:
         try:
-            with open(str(arguments[0]), "r") as f:
-                return LoxString(f.read())
+            return LoxString(pathlib.Path(str(arguments[0])).read_text())
         except FileNotFoundError:
             raise PyLoxFileNotFoundError(f"File '{arguments[0]}' not found.")
 
 
-@dataclasses.dataclass
 class ReadLines(BuiltInCallable):
+    __slots__ = ()
     _short_name = "read_lines"
-
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[LoxString], /) -> LoxArray:
         try:
-            with open(str(arguments[0]), "r") as f:
-                return LoxArray(f.readlines())
+            text = pathlib.Path(str(arguments[0])).read_text()
+            return LoxArray(text.splitlines(keepends=True))
         except FileNotFoundError:
             raise PyLoxFileNotFoundError(f"File '{arguments[0]}' not found.")
 
 
-@dataclasses.dataclass
 class Write(BuiltInCallable):
+    __slots__ = ()
     _short_name = "write"
-
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[LoxString], /) -> None:
         try:
@@ -1,4 +1,3 @@
-import dataclasses
 import math
 import statistics
 import typing as t
@@ -13,6 +12,13 @@ if t.TYPE_CHECKING:
 
 NUMERIC = t.Union[int, float]
 
+_ceil = math.ceil
+_floor = math.floor
+_pow = math.pow
+_median = statistics.median
+_mean = statistics.fmean
+_mode = statistics.mode
+
 
 class SupportsIndex(t.Protocol):
     def __index__(self) -> int:
@@ -22,109 +28,83 @@ class SupportsIndex(t.Protocol):
         ...
 
 
-@dataclasses.dataclass
 class Absolute(BuiltInCallable):
-    _short_name: str = "abs"
+    __slots__ = ()
+    _short_name = "abs"
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> NUMERIC:
         return abs(arguments[0])
 
-    @property
-    def arity(self) -> int:
-        return 1
-
 
-@dataclasses.dataclass
 class Ceil(BuiltInCallable):
-    _short_name: str = "ceil"
+    __slots__ = ()
+    _short_name = "ceil"
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> int:
-        return math.ceil(arguments[0])
+        return _ceil(arguments[0])
 
-    @property
-    def arity(self) -> int:
-        return 1
 
-
-@dataclasses.dataclass
 class Floor(BuiltInCallable):
-    _short_name: str = "floor"
+    __slots__ = ()
+    _short_name = "floor"
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> int:
-        return math.floor(arguments[0])
-
-    @property
-    def arity(self) -> int:
-        return 1
+        return _floor(arguments[0])
 
 
-@dataclasses.dataclass
 class Pow(BuiltInCallable):
-    _short_name: str = "pow"
+    __slots__ = ()
+    _short_name = "pow"
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> float:
-        return math.pow(*arguments)
+        return _pow(arguments[0], arguments[1])
 
-    @property
-    def arity(self) -> int:
-        return 2
 
-
-@dataclasses.dataclass
 class Round(BuiltInCallable):
-    _short_name: str = "round"
+    __slots__ = ()
+    _short_name = "round"
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[SupportsIndex], /) -> NUMERIC:
-        return round(*arguments)
-
-    @property
-    def arity(self) -> int:
-        return 2
+        return round(arguments[0], arguments[1])
 
 
-@dataclasses.dataclass
 class DivMod(BuiltInCallable):
-    _short_name: str = "divmod"
+    __slots__ = ()
+    _short_name = "divmod"
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxArray:
-        return divmod(*arguments)
-
-    @property
-    def arity(self) -> int:
-        return 2
+        numerator, denominator = arguments
+        return LoxArray([numerator // denominator, numerator % denominator])
 
 
-@dataclasses.dataclass
 class Median(BuiltInCallable):
-    _short_name: str = "median"
+    __slots__ = ()
+    _short_name = "median"
+    arity = 1
 
-    def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> float:
-        return statistics.median(arguments)
-
-    @property
-    def arity(self) -> int:
-        return 1
+    def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> float:
+        return _median(arguments)
 
 
-@dataclasses.dataclass
 class Mean(BuiltInCallable):
-    _short_name: str = "mean"
-
-    def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> float:
-        return statistics.mean(arguments)
+    __slots__ = ()
+    _short_name = "mean"
+    arity = 1
 
-    @property
-    def arity(self) -> int:
-        return 1
+    def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> float:
+        return _mean(arguments)
 
 
-@dataclasses.dataclass
 class Mode(BuiltInCallable):
-    _short_name: str = "mode"
-
-    def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> float:
-        return statistics.mode(arguments)
+    __slots__ = ()
+    _short_name = "mode"
+    arity = 1
 
-    @property
-    def arity(self) -> int:
-        return 1
+    def __call__(self, interpreter: "Interpreter", arguments: list[NUMERIC], /) -> NUMERIC:
+        return _mode(arguments)
@@ -1,5 +1,5 @@
-import dataclasses
 import typing as t
+from bisect import bisect_left
 
 from src.exceptions import PyLoxAttributeError, PyLoxIndexError, PyLoxRuntimeError
 
@@ -14,13 +14,18 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("LoxArray",)
 
 
+_IMMUTABLE_TYPES = frozenset({int, float, bool, str, type(None)})
+
+
 # pyright: reportIncompatibleVariableOverride=false
 
 
-@dataclasses.dataclass
 class ArrayCallable(LoxCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ("parent", "token")
+
+    def __init__(self, parent: "LoxArray", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     @property
     def arity(self) -> int:
@@ -30,128 +35,113 @@ class ArrayCallable(LoxCallable):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
 class Append(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         self.parent.fields.append(arguments[0])
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Insert(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
-        idx, value = arguments
         try:
-            self.parent.fields.insert(idx, value)
+            self.parent.fields.insert(arguments[0], arguments[1])
         except IndexError:
             raise PyLoxIndexError(interpreter.error(self.token, "Index out of range."))
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Remove(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         try:
             self.parent.fields.remove(arguments[0])
         except ValueError:
             raise PyLoxRuntimeError(interpreter.error(self.token, "Value not found."))
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Contains(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> bool:
-        return arguments[0] in self.parent.fields
+        fields = self.parent.fields
+        value = arguments[0]
+        if self.parent._sorted:
+            try:
+                idx = bisect_left(fields, value)
+            except TypeError:
+                return value in fields
+            return idx < len(fields) and fields[idx] == value
+        return value in fields
 
 
-@dataclasses.dataclass
 class Clear(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         self.parent.fields.clear()
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Pop(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> t.Any:
+        self.parent._str_cache = None
+        self.parent._sorted = False
         try:
             return self.parent.fields.pop(arguments[0])
         except IndexError:
             raise PyLoxIndexError(interpreter.error(self.token, "Index out of range."))
 
 
-@dataclasses.dataclass
 class Reverse(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         self.parent.fields.reverse()
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Sort(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         self.parent.fields.sort()
+        self.parent._str_cache = None
+        self.parent._sorted = True
 
 
-@dataclasses.dataclass
 class Join(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> str:
         try:
@@ -160,47 +150,36 @@ class Join(ArrayCallable):
             raise PyLoxRuntimeError(interpreter.error(self.token, "Invalid separator."))
 
 
-@dataclasses.dataclass
 class Slice(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> "LoxArray":
-        start, end = arguments
         try:
-            return LoxArray(self.parent.fields[start:end])
+            return LoxArray(self.parent.fields[arguments[0] : arguments[1]])
         except TypeError:
             raise PyLoxRuntimeError(interpreter.error(self.token, "Invalid slice."))
 
 
-@dataclasses.dataclass
 class Extend(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> None:
         try:
             self.parent.fields.extend(arguments[0])
         except TypeError:
             raise PyLoxRuntimeError(interpreter.error(self.token, "Invalid iterable."))
+        self.parent._str_cache = None
+        self.parent._sorted = False
 
 
-@dataclasses.dataclass
 class Copy(ArrayCallable):
-    parent: "LoxArray"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> "LoxArray":
         return LoxArray(self.parent.fields.copy())
@@ -227,19 +206,37 @@ class LoxArray(LoxContainer):
     def __init__(self, fields: t.Optional[list[t.Any]] = None) -> None:
         self.parent = LoxArray
         self.fields = fields or []
+        self._method_cache: dict[str, ArrayCallable] = {}
+        self._str_cache: t.Optional[str] = None
+        self._sorted = False
 
     def __mul__(self, other: int, /) -> "LoxArray":
         return LoxArray(self.fields * other)
 
+    def __setitem__(self, index: int, value: t.Any, /) -> None:
+        self.fields[index] = value
+        self._str_cache = None
+        self._sorted = False
+
     def __str__(self) -> str:
-        return f"[{', '.join(map(str, self.fields))}]"
+        if self._str_cache is not None:
+            return self._str_cache
+        text = f"[{', '.join([field if type(field) is str else str(field) for field in self.fields])}]"
+        if all(type(field) in _IMMUTABLE_TYPES for field in self.fields):
+            self._str_cache = text
+        return text
 
     def get(self, name: "Token", /) -> t.Any:
-        try:
+        lexeme = name.lexeme
+        if lexeme == "get" or lexeme == "set":
             return super().get(name)
-        except PyLoxAttributeError:
-            pass
-        try:
-            return self.methods[name.lexeme](self, name)  # type: ignore
-        except KeyError:
-            raise PyLoxAttributeError(f"Array has no method '{name.lexeme}'.")
+        method = self._method_cache.get(lexeme)
+        if method is not None:
+            method.token = name
+            return method
+        method_type = self.methods.get(lexeme)
+        if method_type is None:
+            raise PyLoxAttributeError(f"Array has no method '{lexeme}'.")
+        method = method_type(self, name)
+        self._method_cache[lexeme] = method
+        return method
@@ -1,4 +1,3 @@
-import dataclasses
 import typing as t
 from abc import ABC, abstractmethod
 
@@ -19,10 +18,15 @@ __all__: tuple[str, ...] = (
 )
 
 
-@dataclasses.dataclass
+_THIS = str(KeywordTokenType.THIS)
+_THIS_TOKEN = Token(KeywordTokenType.THIS, "this", None, 0, 0)
+
+
 class LoxCallable(ABC):
     """Base class for callables."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def arity(self) -> int:
@@ -38,11 +42,15 @@ class LoxCallable(ABC):
         return f"<{self.__class__.__name__} at {hex(id(self))}>"
 
 
-@dataclasses.dataclass
 class LoxFunction(LoxCallable):
-    declaration: t.Union["Function", "Lambda"]
-    closure: Environment
-    is_initializer: bool = False
+    __slots__ = ("declaration", "closure", "is_initializer")
+
+    def __init__(
+        self, declaration: t.Union["Function", "Lambda"], closure: Environment, is_initializer: bool = False
+    ) -> None:
+        self.declaration = declaration
+        self.closure = closure
+        self.is_initializer = is_initializer
 
     @property
     def arity(self) -> int:
@@ -52,26 +60,30 @@ class LoxFunction(LoxCallable):
         environment = Environment(self.closure)
         for param, argument in zip(self.declaration.params, arguments):
             environment.define(param, argument)
+        is_initializer = self.is_initializer
         try:
             interpreter._execute_block(self.declaration.body, environment)
         except PyLoxReturnError as e:
-            if self.is_initializer:
-                return self.closure.get_at(0, str(KeywordTokenType.THIS))
-            return e.value
-        if self.is_initializer:
-            return self.closure.get_at(0, str(KeywordTokenType.THIS))
+            return self.closure.values[_THIS] if is_initializer else e.value
+        return self.closure.values[_THIS] if is_initializer else None
 
     def bind(self, instance: "LoxInstance", /) -> "LoxFunction":
         environment = Environment(self.closure)
-        environment.define(Token(KeywordTokenType.THIS, "this", None, 0, 0), instance)
+        environment.define(_THIS_TOKEN, instance)
         return LoxFunction(self.declaration, environment, self.is_initializer)
 
 
-@dataclasses.dataclass
 class LoxClass(LoxCallable):
-    name: str
-    superclass: t.Optional["LoxClass"]
-    methods: t.Dict[str, LoxFunction]
+    __slots__ = ("name", "superclass", "methods", "_flat_methods")
+
+    def __init__(self, name: str, superclass: t.Optional["LoxClass"], methods: t.Dict[str, LoxFunction]) -> None:
+        self.name = name
+        self.superclass = superclass
+        self.methods = methods
+        if superclass is not None:
+            self._flat_methods = superclass._flat_methods | methods
+        else:
+            self._flat_methods = dict(methods)
 
     @property
     def arity(self) -> int:
@@ -88,20 +100,28 @@ class LoxClass(LoxCallable):
         return instance
 
     def find_method(self, name: str, /) -> t.Optional[LoxFunction]:
-        return self.methods.get(name) or self.superclass and self.superclass.find_method(name)
+        return self._flat_methods.get(name)
 
 
-@dataclasses.dataclass
 class LoxInstance:
-    parent: LoxClass
-    fields: t.Dict[t.Any, t.Any] = dataclasses.field(default_factory=dict)
+    __slots__ = ("parent", "fields", "_bound")
+
+    def __init__(self, parent: LoxClass, fields: t.Optional[t.Dict[t.Any, t.Any]] = None) -> None:
+        self.parent = parent
+        self.fields = fields if fields is not None else {}
+        self._bound: t.Dict[str, LoxFunction] = {}
 
     def get(self, name: Token, /) -> t.Any:
         if name.lexeme in self.fields:
             return self.fields[name.lexeme]
+        bound = self._bound.get(name.lexeme)
+        if bound is not None:
+            return bound
         method = self.parent.find_method(name.lexeme)
         if method:
-            return method.bind(self)
+            bound = method.bind(self)
+            self._bound[name.lexeme] = bound
+            return bound
         raise PyLoxRuntimeError(f"Undefined property '{name.lexeme}'.")
 
     def set(self, name: Token, value: t.Any, /) -> None:
@@ -1,4 +1,3 @@
-import dataclasses
 import typing as t
 
 from src.exceptions import PyLoxAttributeError
@@ -13,13 +12,17 @@ if t.TYPE_CHECKING:
 
 __all__: tuple[str, ...] = ("LoxHash",)
 
+_MISSING: t.Any = object()
+
 # pyright: reportIncompatibleVariableOverride=false
 
 
-@dataclasses.dataclass
 class HashCallable(LoxCallable):
-    parent: "LoxHash"
-    token: "Token"
+    __slots__ = ("parent", "token")
+
+    def __init__(self, parent: "LoxHash", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     @property
     def arity(self) -> int:
@@ -29,41 +32,35 @@ class HashCallable(LoxCallable):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
 class Get(HashCallable):
-    parent: "LoxHash"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> t.Any:
-        return self.parent.fields.get(arguments[0]) or self.parent.fields.get(str(arguments[0]))
+        fields = self.parent.fields
+        value = fields.get(arguments[0], _MISSING)
+        if value is not _MISSING:
+            return value
+        return fields.get(str(arguments[0]))
 
 
-@dataclasses.dataclass
 class Set(HashCallable):
-    parent: "LoxHash"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> t.Any:
-        if arguments[0] in self.parent.fields:
-            self.parent.fields[arguments[0]] = arguments[1]
-            return arguments[1]
-        elif str(arguments[0]) in self.parent.fields:
-            self.parent.fields[str(arguments[0])] = arguments[1]
-            return arguments[1]
-        else:
-            try:
-                self.parent.fields[arguments[0]] = arguments[1]
-                return arguments[1]
-            except TypeError:
-                raise PyLoxAttributeError(f"Undefined property '{arguments[0]}'.")
+        fields = self.parent.fields
+        key, value = arguments[0], arguments[1]
+        try:
+            if key in fields or str(key) not in fields:
+                fields[key] = value
+            else:
+                fields[str(key)] = value
+            return value
+        except TypeError:
+            raise PyLoxAttributeError(f"Undefined property '{key}'.")
 
 
 class LoxHash(LoxContainer):
@@ -74,6 +71,7 @@ class LoxHash(LoxContainer):
     def __init__(self) -> None:
         self.parent = LoxHash
         self.fields = {}
+        self._method_cache: dict[str, HashCallable] = {}
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.fields})"
@@ -91,10 +89,17 @@ class LoxHash(LoxContainer):
         self.fields[key] = value
 
     def get(self, name: "Token", /) -> t.Any:
-        try:
-            return self.methods[name.lexeme](self, name)  # type: ignore
-        except KeyError:
-            raise PyLoxAttributeError(f"Undefined property '{name.lexeme}'.")
+        lexeme = name.lexeme
+        method = self._method_cache.get(lexeme)
+        if method is not None:
+            method.token = name
+            return method
+        method_type = self.methods.get(lexeme)
+        if method_type is None:
+            raise PyLoxAttributeError(f"Undefined property '{lexeme}'.")
+        method = method_type(self, name)
+        self._method_cache[lexeme] = method
+        return method
 
     @classmethod
     def from_dict(cls, fields: dict[t.Any, t.Any], /) -> "LoxHash":
@@ -1,8 +1,5 @@
-import dataclasses
 import typing as t
 
-import requests
-
 from src.exceptions import PyLoxAttributeError, PyLoxRuntimeError
 from src.internals.hash import LoxHash
 
@@ -10,6 +7,8 @@ from .callables import LoxCallable
 from .types import LoxContainer
 
 if t.TYPE_CHECKING:
+    import requests
+
     from src.interpreter.interpreter import Interpreter
     from src.lexer.tokens import Token
 
@@ -17,13 +16,33 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("LoxRequest",)
 
 
+_REQUEST_TIMEOUT = 30.0
+
+_session: t.Optional["requests.Session"] = None
+
+
+def _get_session() -> "requests.Session":
+    """Create the shared HTTP session on first use so keep-alive connections are reused."""
+    global _session
+    if _session is None:
+        import requests
+
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
 # pyright: reportIncompatibleVariableOverride=false
 
 
-@dataclasses.dataclass
 class RequestCallable(LoxCallable):
-    parent: "LoxRequest"
-    token: "Token"
+    __slots__ = ("parent", "token")
+
+    def __init__(self, parent: "LoxRequest", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     @property
     def arity(self) -> int:
@@ -33,29 +52,29 @@ class RequestCallable(LoxCallable):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
 class Get(RequestCallable):
-    parent: "LoxRequest"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
+
+    _model_keys: t.ClassVar[tuple[str, ...]] = ("status_code", "url", "headers", "encoding", "reason", "ok", "text")
 
     @staticmethod
-    def _make_model(fields: requests.models.Response, /) -> LoxHash:
+    def _make_model(fields: "requests.models.Response", /) -> LoxHash:
         try:
             return LoxHash.from_dict(fields.json())
         except ValueError:
             data = LoxHash()
-            for key in dir(fields):
-                if not key.startswith("_") and not callable(getattr(fields, key)):
-                    data[key] = getattr(fields, key)
+            for key in Get._model_keys:
+                data[key] = getattr(fields, key)
+            data["headers"] = dict(data["headers"])
             return data
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxHash:
+        import requests
+
         try:
-            return self._make_model(requests.get(arguments[0]))
+            return self._make_model(_get_session().get(arguments[0], timeout=_REQUEST_TIMEOUT))
         except requests.exceptions.RequestException as e:
             raise PyLoxRuntimeError(interpreter.error(self.token, f"Request failed: {e}"))
 
@@ -69,9 +88,17 @@ class LoxRequest(LoxContainer):
 
     def __init__(self, /) -> None:
         self.parent = LoxRequest
+        self._method_cache: dict[str, RequestCallable] = {}
 
     def get(self, name: "Token", /) -> t.Any:
-        try:
-            return self._methods[name.lexeme](self, name)  # type: ignore
-        except KeyError:
-            raise PyLoxAttributeError(f"Attribute {name.lexeme} not found.")
+        lexeme = name.lexeme
+        method = self._method_cache.get(lexeme)
+        if method is not None:
+            method.token = name
+            return method
+        method_type = self._methods.get(lexeme)
+        if method_type is None:
+            raise PyLoxAttributeError(f"Attribute {lexeme} not found.")
+        method = method_type(self, name)
+        self._method_cache[lexeme] = method
+        return method
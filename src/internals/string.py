@@ -1,4 +1,3 @@
-import dataclasses
 import typing as t
 
 from src.exceptions import PyLoxAttributeError
@@ -15,13 +14,34 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("LoxString",)
 
 
+_STR_CHECKS: dict[str, t.Callable[[str], bool]] = {
+    name: getattr(str, name)
+    for name in (
+        "isalnum",
+        "isalpha",
+        "isdecimal",
+        "isdigit",
+        "isidentifier",
+        "islower",
+        "isnumeric",
+        "isprintable",
+        "isspace",
+        "istitle",
+        "isupper",
+        "isascii",
+    )
+}
+
+
 # pyright: reportIncompatibleVariableOverride=false
 
 
-@dataclasses.dataclass
 class StringCallable(LoxCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ("parent", "token")
+
+    def __init__(self, parent: "LoxString", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     @property
     def arity(self) -> int:
@@ -31,83 +51,62 @@ class StringCallable(LoxCallable):
         raise NotImplementedError
 
 
-@dataclasses.dataclass
 class Lower(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> str:
         return self.parent.fields.lower()
 
 
-@dataclasses.dataclass
 class Upper(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> str:
         return self.parent.fields.upper()
 
 
-@dataclasses.dataclass
 class Replace(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> str:
         self.parent.fields = self.parent.fields.replace(str(arguments[0]), str(arguments[1]))
         return self.parent.fields
 
 
-@dataclasses.dataclass
 class Split(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> LoxArray:
-        return LoxArray([LoxString(s) for s in self.parent.fields.split(str(arguments[0]))])
+        return LoxArray(self.parent.fields.split(str(arguments[0])))
 
 
-@dataclasses.dataclass
 class Check(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ("_fn",)
 
-    @property
-    def arity(self) -> int:
-        return 0
+    arity = 0
+
+    def __init__(self, parent: "LoxString", token: "Token") -> None:
+        super().__init__(parent, token)
+        self._fn = _STR_CHECKS.get(token.lexeme)
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> bool:
-        check = getattr(self.parent.fields, self.token.lexeme)
-        if check is None:
+        if self._fn is None:
             raise PyLoxAttributeError(interpreter.error(self.token, f"String has no attribute {self.token.lexeme!r}."))
-        return check()
+        return self._fn(self.parent.fields)
 
 
-@dataclasses.dataclass
 class Contains(StringCallable):
-    parent: "LoxString"
-    token: "Token"
+    __slots__ = ()
 
-    @property
-    def arity(self) -> int:
-        return 1
+    arity = 1
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> bool:
         return str(arguments[0]) in str(self.parent.fields)
@@ -137,8 +136,9 @@ class LoxString(LoxContainer):
     }
 
     def __init__(self, fields: str, /) -> None:
-        self.fields = str(fields)
+        self.fields = fields if type(fields) is str else str(fields)
         self.parent = LoxString
+        self._method_cache: dict[str, StringCallable] = {}
 
     def __str__(self) -> str:
         return str(self.fields)
@@ -155,15 +155,29 @@ class LoxString(LoxContainer):
     def __mul__(self, other: int) -> "LoxString":
         return LoxString(self.fields * other)
 
+    def __eq__(self, other: t.Any) -> bool:
+        if other is self:
+            return True
+        if type(other) is str:
+            return self.fields == other
+        if isinstance(other, LoxContainer):
+            return self.fields == other.fields
+        return False
+
     def __hash__(self) -> int:
         return hash(self.fields)
 
     def get(self, name: "Token", /) -> t.Any:
-        try:
+        lexeme = name.lexeme
+        if lexeme == "get" or lexeme == "set":
             return super().get(name)
-        except PyLoxAttributeError:
-            pass
-        try:
-            return self.methods[name.lexeme](self, name)  # type: ignore
-        except KeyError:
-            raise PyLoxAttributeError(f"String has no method '{name.lexeme}'.")
+        method = self._method_cache.get(lexeme)
+        if method is not None:
+            method.token = name
+            return method
+        method_type = self.methods.get(lexeme)
+        if method_type is None:
+            raise PyLoxAttributeError(f"String has no method '{lexeme}'.")
+        method = method_type(self, name)
+        self._method_cache[lexeme] = method
+        return method
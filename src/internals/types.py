@@ -1,4 +1,3 @@
-import dataclasses
 import typing as t
 
 from src.exceptions import PyLoxAttributeError, PyLoxIndexError, PyLoxTypeError
@@ -17,31 +16,31 @@ __all__: tuple[str, ...] = (
 )
 
 
-@dataclasses.dataclass
 class SetContainer(LoxCallable):
-    parent: "LoxContainer"
-    token: "Token"
+    __slots__ = ("parent", "token")
 
-    @property
-    def arity(self) -> int:
-        return 2
+    arity = 2
+
+    def __init__(self, parent: "LoxContainer", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> t.Any:
         idx, value = arguments
         try:
-            self.parent.fields[idx] = value
+            self.parent[idx] = value
         except IndexError:
             raise PyLoxIndexError(interpreter.error(self.token, "Index out of range."))
 
 
-@dataclasses.dataclass
 class GetContainer(LoxCallable):
-    parent: "LoxContainer"
-    token: "Token"
+    __slots__ = ("parent", "token")
+
+    arity = 1
 
-    @property
-    def arity(self) -> int:
-        return 1
+    def __init__(self, parent: "LoxContainer", token: "Token") -> None:
+        self.parent = parent
+        self.token = token
 
     def __call__(self, interpreter: "Interpreter", arguments: list[t.Any], /) -> t.Any:
         try:
@@ -50,8 +49,9 @@ class GetContainer(LoxCallable):
             raise PyLoxIndexError(interpreter.error(self.token, "Index out of range."))
 
 
-@dataclasses.dataclass
 class LoxContainer(LoxInstance):
+    __slots__ = ("_gc", "_sc")
+
     def __len__(self) -> int:
         return len(self.fields)
 
@@ -105,13 +105,23 @@ class LoxContainer(LoxInstance):
         return f"{self.__class__.__name__}({self.fields})"
 
     def get(self, name: "Token", /) -> t.Any:
-        match name.lexeme:
-            case "get":
-                return GetContainer(self, name)
-            case "set":
-                return SetContainer(self, name)
-            case _:
-                raise PyLoxAttributeError(f"Unknown attribute '{name.lexeme}'.")
+        if name.lexeme == "get":
+            try:
+                handler = self._gc
+            except AttributeError:
+                handler = self._gc = GetContainer(self, name)
+                return handler
+            handler.token = name
+            return handler
+        if name.lexeme == "set":
+            try:
+                handler = self._sc
+            except AttributeError:
+                handler = self._sc = SetContainer(self, name)
+                return handler
+            handler.token = name
+            return handler
+        raise PyLoxAttributeError(f"Unknown attribute '{name.lexeme}'.")
 
     def set(self, name: "Token", value: t.Any, /) -> None:
         raise PyLoxAttributeError(f"Cannot set attribute '{name.lexeme}' on {self.__class__.__name__}.")
@@ -1,8 +1,6 @@
-import inspect
-import pathlib
 import typing as t
 
-from src.builtins import BuiltInCallable
+from src.builtins import BUILT_INS
 from src.exceptions import PyLoxBreakError, PyLoxContinueError, PyLoxReturnError, PyLoxRuntimeError, PyLoxTypeError
 from src.internals.array import LoxArray
 from src.internals.callables import LoxCallable, LoxClass, LoxFunction, LoxInstance
@@ -10,8 +8,8 @@ from src.internals.hash import LoxHash
 from src.internals.string import LoxString
 from src.lexer.tokens import ComplexTokenType, KeywordTokenType, SimpleTokenType, Token
 from src.utils.environment import Environment
-from src.utils.expr import Block
-from src.utils.protocol import StmtProtocol, VisitorProtocol
+from src.utils.expr import Block, Expr
+from src.utils.protocol import StmtProtocol, VisitorBase, VisitorProtocol
 
 if t.TYPE_CHECKING:
     from src.logger import Logger
@@ -22,7 +20,6 @@ if t.TYPE_CHECKING:
         Call,
         Class,
         Continue,
-        Expr,
         Expression,
         For,
         Function,
@@ -53,62 +50,234 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("Interpreter",)
 
 
+_BREAK = PyLoxBreakError("Break nil")
+_CONTINUE = PyLoxContinueError("Continue nil")
+
+_SUPER_TOKEN = Token(KeywordTokenType.SUPER, "super", None, 0, 0)
+
+_BUILTIN_TOKENS: dict[str, Token] = {}
+
+_MISSING: t.Any = object()
+
+
 class Equals(t.Protocol):
     def __eq__(self, other: t.Any, /) -> bool:
         ...
 
 
-class Interpreter(VisitorProtocol, StmtProtocol):
+def _is_equal(left: Equals, right: Equals, /) -> bool:
+    """Check if two objects are equal."""
+    if type(left) != type(right):
+        return False
+    return left == right
+
+
+def _stringify(obj: t.Any, /) -> str:
+    """Stringify an object."""
+    if obj is None:
+        return str(KeywordTokenType.NIL)
+    if isinstance(obj, bool):
+        return str(obj).lower()
+    return str(obj)
+
+
+def _is_truthy(obj: t.Any, /) -> bool:
+    """Check if an object is truthy."""
+    return bool(obj)
+
+
+def _converter(value: t.Any, /) -> t.Any:
+    if isinstance(value, str):
+        return LoxString(value)
+    elif isinstance(value, list):
+        return LoxArray(value)
+    elif isinstance(value, dict):
+        return LoxHash.from_dict(value)
+    return value
+
+
+def _num2(left: t.Any, right: t.Any, /) -> bool:
+    """Fast exact-type check for a pair of numeric operands."""
+    lt, rt = type(left), type(right)
+    return (lt is int or lt is float) and (rt is int or rt is float)
+
+
+def _op_minus(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    try:
+        return left - right
+    except TypeError:
+        interpreter._numeric_validation(operator, left, right)
+        raise
+
+
+def _op_plus(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if type(left) in (int, float) and type(right) in (int, float):
+        return left + right
+    if isinstance(left, LoxString) and isinstance(right, LoxString):
+        return LoxString(str(left) + str(right))
+    if isinstance(left, LoxArray) and isinstance(right, LoxArray):
+        return LoxArray(left.fields + right.fields)
+    raise PyLoxRuntimeError(interpreter.error(operator, "Operands must be two numbers or two strings."))
+
+
+def _op_slash(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    try:
+        return left / right
+    except ZeroDivisionError:
+        raise PyLoxRuntimeError(interpreter.error(operator, "Division by zero."))
+    except TypeError:
+        interpreter._numeric_validation(operator, left, right)
+        raise
+
+
+def _op_backslash(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    try:
+        return left // right
+    except ZeroDivisionError:
+        raise PyLoxRuntimeError(interpreter.error(operator, "Division by zero."))
+    except TypeError:
+        interpreter._numeric_validation(operator, left, right)
+        raise
+
+
+def _op_star(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if isinstance(left, LoxString) and isinstance(right, int):
+        return LoxString(str(left) * right)
+    if isinstance(left, int) and isinstance(right, LoxString):
+        return LoxString(str(right) * left)
+    if isinstance(left, LoxArray) and isinstance(right, int):
+        return LoxArray(left.fields * right)
+    if isinstance(left, int) and isinstance(right, LoxArray):
+        return LoxArray(left * right.fields)
+    interpreter._numeric_validation(operator, left, right)
+    return left * right
+
+
+def _op_modulo(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    try:
+        return left % right
+    except TypeError:
+        interpreter._numeric_validation(operator, left, right)
+        raise
+
+
+def _op_carat(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    try:
+        return left**right
+    except TypeError:
+        interpreter._numeric_validation(operator, left, right)
+        raise
+
+
+def _op_greater(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if _num2(left, right):
+        return left > right
+    interpreter._numeric_validation(operator, left, right)
+    return left > right
+
+
+def _op_greater_equal(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if _num2(left, right):
+        return left >= right
+    interpreter._numeric_validation(operator, left, right)
+    return left >= right
+
+
+def _op_less(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if _num2(left, right):
+        return left < right
+    interpreter._numeric_validation(operator, left, right)
+    return left < right
+
+
+def _op_less_equal(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    if _num2(left, right):
+        return left <= right
+    interpreter._numeric_validation(operator, left, right)
+    return left <= right
+
+
+def _op_bang_equal(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    return not _is_equal(left, right)
+
+
+def _op_equal_equal(interpreter: "Interpreter", operator: "Token", left: t.Any, right: t.Any) -> t.Any:
+    return _is_equal(left, right)
+
+
+def _op_negate(interpreter: "Interpreter", operator: "Token", right: t.Any) -> t.Any:
+    if type(right) is int or type(right) is float:
+        return -right
+    interpreter._numeric_validation(operator, right)
+    return -right
+
+
+def _op_bang(interpreter: "Interpreter", operator: "Token", right: t.Any) -> t.Any:
+    return not _is_truthy(right)
+
+
+_BINARY_OPS: dict[t.Any, t.Callable[["Interpreter", "Token", t.Any, t.Any], t.Any]] = {
+    SimpleTokenType.MINUS: _op_minus,
+    SimpleTokenType.PLUS: _op_plus,
+    SimpleTokenType.SLASH: _op_slash,
+    ComplexTokenType.BACKSLASH: _op_backslash,
+    SimpleTokenType.STAR: _op_star,
+    SimpleTokenType.MODULO: _op_modulo,
+    SimpleTokenType.CARAT: _op_carat,
+    ComplexTokenType.GREATER: _op_greater,
+    ComplexTokenType.GREATER_EQUAL: _op_greater_equal,
+    ComplexTokenType.LESS: _op_less,
+    ComplexTokenType.LESS_EQUAL: _op_less_equal,
+    ComplexTokenType.BANG_EQUAL: _op_bang_equal,
+    ComplexTokenType.EQUAL_EQUAL: _op_equal_equal,
+}
+
+_UNARY_OPS: dict[t.Any, t.Callable[["Interpreter", "Token", t.Any], t.Any]] = {
+    SimpleTokenType.MINUS: _op_negate,
+    SimpleTokenType.BANG: _op_bang,
+}
+
+
+class Interpreter(VisitorBase, VisitorProtocol, StmtProtocol):
     _environment: Environment
-    builtins: pathlib.Path = pathlib.Path("src/builtins")
 
     def __init__(self, lox: "PyLox", logger: "Logger") -> None:
         self._lox = lox
         self._logger = logger
         self._environment = Environment()
-        self._locals: t.Dict["Expr", int] = {}
+        self._dispatch: t.Dict[type, t.Callable[[t.Any], t.Any]] = self._bind_dispatch()
+        self._source_key: t.Optional[str] = None
+        self._source_lines: list[str] = []
         self._load_builtins()
 
     def _load_builtins(self) -> None:
         """Load builtins."""
-        for file in self.builtins.glob("*.py"):
-            self._logger.debug(f"Loading builtin '{file.name}'...")
-            methods = inspect.getmembers(__import__(f"src.builtins.{file.stem}", fromlist=["*"]), inspect.isclass)
-            for _, method in methods:
-                if issubclass(method, BuiltInCallable) and method is not BuiltInCallable:
-                    if getattr(method, "_setup", False):
-                        token = Token(KeywordTokenType.VAR, method._short_name, None, 0, 0)
-                        self._environment.define(token, method()())  # type: ignore
-                        continue
-                    token = Token(KeywordTokenType.FUN, method._short_name, None, 0, 0)
-                    self._environment.define(token, method())  # type: ignore
+        for name, builtin in BUILT_INS.items():
+            if getattr(builtin, "_setup", False):
+                token = _BUILTIN_TOKENS.get(name)
+                if token is None:
+                    token = _BUILTIN_TOKENS[name] = Token(KeywordTokenType.VAR, name, None, 0, 0)
+                self._environment.define(token, builtin())
+                continue
+            token = _BUILTIN_TOKENS.get(name)
+            if token is None:
+                token = _BUILTIN_TOKENS[name] = Token(KeywordTokenType.FUN, name, None, 0, 0)
+            self._environment.define(token, builtin)
 
     def error(self, token: "Token", message: str, /) -> str:
         """Raise a runtime error."""
-        line = self._lox._source.splitlines()[token.line - 1]
+        source = self._lox._source
+        if source is not self._source_key:
+            self._source_key = source
+            self._source_lines = source.splitlines()
+        line = self._source_lines[token.line - 1]
         error_ = f"\n{line}\n{'~' * token.column}^\n{str(message)}"
         return f"RuntimeError at line {token.line  - self._lox._process.lines}:{token.column}{error_}"
 
-    @staticmethod
-    def is_equal(left: Equals, right: Equals, /) -> bool:
-        """Check if two objects are equal."""
-        if type(left) != type(right):
-            return False
-        return left == right
-
-    @staticmethod
-    def stringify(obj: t.Any) -> str:
-        """Stringify an object."""
-        if obj is None:
-            return str(KeywordTokenType.NIL)
-        if isinstance(obj, bool):
-            return str(obj).lower()
-        return str(obj)
-
-    @staticmethod
-    def is_truthy(obj: t.Any) -> bool:
-        """Check if an object is truthy."""
-        return bool(obj)
+    is_equal = staticmethod(_is_equal)
+    stringify = staticmethod(_stringify)
+    is_truthy = staticmethod(_is_truthy)
+    _converter = staticmethod(_converter)
 
     def _numeric_validation(self, operator: "Token", *operands: t.Any) -> None:
         """Validate numeric operands."""
@@ -121,45 +290,37 @@ class Interpreter(VisitorProtocol, StmtProtocol):
 
     def interpret(self, statements: list["Stmt"]) -> None:
         """Interpret a list of statements."""
+        dispatch = self._dispatch
         try:
             for statement in statements:
-                self._evaluate(statement)
+                dispatch[type(statement)](statement)
         except PyLoxRuntimeError as error:
             self._logger.error(str(error))
 
-    @staticmethod
-    def _converter(value: t.Any) -> t.Any:
-        if isinstance(value, str):
-            return LoxString(value)
-        elif isinstance(value, list):
-            return LoxArray(value)
-        elif isinstance(value, dict):
-            return LoxHash.from_dict(value)
-        return value
-
     def _evaluate(self, expression: t.Union["Expr", "Stmt"]) -> t.Any:
         """Evaluate an expression."""
-        return self._converter(expression.accept(self))
+        return self._dispatch[type(expression)](expression)
 
     def _resolve(self, expr: "Expr", depth: int) -> None:
         """Resolve an expression."""
-        self._locals[expr] = depth
+        expr._depth = depth
 
     def _execute_block(self, statements: list["Stmt"], environment: Environment) -> None:
         """Execute a block of statements."""
         previous: Environment = self._environment
+        dispatch = self._dispatch
         try:
             self._environment = environment
             for statement in statements:
-                self._evaluate(statement)
+                dispatch[type(statement)](statement)
         finally:
             self._environment = previous
 
     def _lookup_variable(self, name: "Token", expr: "Expr") -> t.Any:
         """Lookup a variable."""
-        distance = self._locals.get(expr)
-        if distance is not None:
-            return self._environment.get_at(distance, name)
+        distance = expr._depth
+        if distance >= 0:
+            return self._environment.get_at(distance, name.lexeme)
         return self._environment.get(name)
 
     def visit_block_stmt(self, stmt: "Block") -> None:
@@ -177,7 +338,7 @@ class Interpreter(VisitorProtocol, StmtProtocol):
         self._environment.define(stmt.name, None)
         if stmt.superclass is not None:
             self._environment = Environment(self._environment)
-            self._environment.define(Token(KeywordTokenType.SUPER, "super", None, 0, 0), super_class)
+            self._environment.define(_SUPER_TOKEN, super_class)
         methods: t.Dict[str, LoxFunction] = {}
         for method in stmt.methods:
             function_: LoxFunction = LoxFunction(method, self._environment, method.name.lexeme == "init")
@@ -203,7 +364,7 @@ class Interpreter(VisitorProtocol, StmtProtocol):
 
     def visit_if_stmt(self, stmt: "If") -> None:
         """Visit an if statement."""
-        if self.is_truthy(self._evaluate(stmt.condition)):
+        if _is_truthy(self._evaluate(stmt.condition)):
             self._evaluate(stmt.then_branch)
         elif stmt.else_branch is not None:
             self._evaluate(stmt.else_branch)
@@ -223,7 +384,7 @@ class Interpreter(VisitorProtocol, StmtProtocol):
 
     def visit_print_stmt(self, stmt: "Print") -> None:
         """Visit a print statement."""
-        value = self.stringify(self._evaluate(stmt.expression))
+        value = _stringify(self._evaluate(stmt.expression))
         print(bytes(value, "utf-8").decode("unicode_escape"))
 
     def visit_return_stmt(self, stmt: "Return") -> None:
@@ -231,7 +392,7 @@ class Interpreter(VisitorProtocol, StmtProtocol):
         value: t.Any = None
         if stmt.value is not None:
             value = self._evaluate(stmt.value)
-        raise PyLoxReturnError(self.error(stmt.keyword, f"Return {self.stringify(value)}"), value)
+        raise PyLoxReturnError(f"Return {_stringify(value)}", value)
 
     def visit_var_stmt(self, stmt: "Var") -> None:
         """Visit a var statement."""
@@ -242,32 +403,42 @@ class Interpreter(VisitorProtocol, StmtProtocol):
 
     def visit_while_stmt(self, stmt: "While") -> None:
         """Visit a while statement."""
+        dispatch = self._dispatch
+        condition, body = stmt.condition, stmt.body
+        evaluate_condition = dispatch[type(condition)]
+        execute_body = dispatch[type(body)]
+        increment = [body.statements[-1]] if stmt.for_transformed and isinstance(body, Block) else None
+        wrapper: t.Optional[Environment] = None
         try:
-            while self.is_truthy(self._evaluate(stmt.condition)):
+            while _is_truthy(evaluate_condition(condition)):
                 try:
-                    self._evaluate(stmt.body)
+                    execute_body(body)
                 except PyLoxContinueError:
-                    if stmt.for_transformed and isinstance(stmt.body, Block):
-                        self._execute_block([stmt.body.statements[-1]], Environment(self._environment))
-                        continue
-                    continue
-        except PyLoxRuntimeError:
+                    if increment is not None:
+                        if wrapper is None:
+                            wrapper = Environment(self._environment)
+                        self._execute_block(increment, wrapper)
+        except PyLoxBreakError:
             return
 
     def visit_break_stmt(self, stmt: "Break") -> t.Any:
         """Visit a break statement."""
-        raise PyLoxBreakError(f"Break {self.stringify(None)}")
+        raise _BREAK
 
     def visit_continue_stmt(self, stmt: "Continue") -> t.Any:
         """Visit a continue statement."""
-        raise PyLoxContinueError(f"Continue {self.stringify(None)}")
+        raise _CONTINUE
 
     def visit_for_stmt(self, stmt: "For") -> t.Any:
         raise NotImplementedError
 
     def visit_literal_expr(self, expr: "Literal") -> t.Any:
         """Visit a literal expression."""
-        return expr.value
+        value = expr.value
+        if type(value) is LoxString:
+            # String methods mutate in place; hand out a fresh copy per evaluation.
+            return LoxString(value.fields)
+        return value
 
     def visit_variable_expr(self, expr: "Variable") -> t.Any:
         """Visit a variable expression."""
@@ -285,10 +456,10 @@ class Interpreter(VisitorProtocol, StmtProtocol):
         """Visit a logical expression."""
         left: t.Any = self._evaluate(expr.left)
         if expr.operator.token_type == KeywordTokenType.OR:
-            if self.is_truthy(left):
+            if _is_truthy(left):
                 return left
         else:
-            if not self.is_truthy(left):
+            if not _is_truthy(left):
                 return left
         return self._evaluate(expr.right)
 
@@ -298,26 +469,25 @@ class Interpreter(VisitorProtocol, StmtProtocol):
         if not isinstance(obj, LoxInstance):
             raise PyLoxRuntimeError(self.error(expr.name, "Only instances have fields."))
         value: t.Any = self._evaluate(expr.value)
-        obj.set(expr.name, value)
+        if type(obj) is LoxInstance:
+            obj.fields[expr.name.lexeme] = value
+        else:
+            obj.set(expr.name, value)
         return value
 
     def visit_unary_expr(self, expr: "Unary") -> t.Any:
         """Visit a unary expression."""
         right: t.Any = self._evaluate(expr.right)
-        match expr.operator.token_type:
-            case SimpleTokenType.MINUS:
-                self._numeric_validation(expr.operator, right)
-                return -right
-            case SimpleTokenType.BANG:
-                return not self.is_truthy(right)
-            case _:
-                raise PyLoxRuntimeError(self.error(expr.operator, f"Unknown unary operator {expr.operator.lexeme}."))
+        handler = _UNARY_OPS.get(expr.operator.token_type)
+        if handler is None:
+            raise PyLoxRuntimeError(self.error(expr.operator, f"Unknown unary operator {expr.operator.lexeme}."))
+        return handler(self, expr.operator, right)
 
     def visit_assign_expr(self, expr: "Assign") -> t.Any:
         """Visit an assign expression."""
         value: t.Any = self._evaluate(expr.value)
-        distance: int | None = self._locals.get(expr)
-        if distance is not None:
+        distance: int = expr._depth
+        if distance >= 0:
             self._environment.assign_at(distance, expr.token, value)
         else:
             self._environment.assign(expr.token, value)
@@ -326,80 +496,31 @@ class Interpreter(VisitorProtocol, StmtProtocol):
     def visit_binary_expr(self, expr: "Binary") -> t.Any:
         """Visit a binary expression."""
         left, right = self._evaluate(expr.left), self._evaluate(expr.right)
-        match expr.operator.token_type:
-            case SimpleTokenType.MINUS:
-                self._numeric_validation(expr.operator, left, right)
-                return left - right
-            case SimpleTokenType.PLUS:
-                if type(left) in (int, float) and type(right) in (int, float):
-                    return left + right
-                if isinstance(left, LoxString) and isinstance(right, LoxString):
-                    return LoxString(str(left) + str(right))
-                if isinstance(left, LoxArray) and isinstance(right, LoxArray):
-                    return LoxArray(left.fields + right.fields)
-                raise PyLoxRuntimeError(self.error(expr.operator, "Operands must be two numbers or two strings."))
-            case SimpleTokenType.SLASH:
-                self._numeric_validation(expr.operator, left, right)
-                try:
-                    return left / right
-                except ZeroDivisionError:
-                    raise PyLoxRuntimeError(self.error(expr.operator, "Division by zero."))
-            case ComplexTokenType.BACKSLASH:
-                self._numeric_validation(expr.operator, left, right)
-                try:
-                    return left // right
-                except ZeroDivisionError:
-                    raise PyLoxRuntimeError(self.error(expr.operator, "Division by zero."))
-            case SimpleTokenType.STAR:
-                if isinstance(left, LoxString) and isinstance(right, int):
-                    return LoxString(str(left) * right)
-                if isinstance(left, int) and isinstance(right, LoxString):
-                    return LoxString(str(right) * left)
-                if isinstance(left, LoxArray) and isinstance(right, int):
-                    return LoxArray(left.fields * right)
-                if isinstance(left, int) and isinstance(right, LoxArray):
-                    return LoxArray(left * right.fields)
-                self._numeric_validation(expr.operator, left, right)
-                return left * right
-            case SimpleTokenType.MODULO:
-                self._numeric_validation(expr.operator, left, right)
-                return left % right
-            case SimpleTokenType.CARAT:
-                self._numeric_validation(expr.operator, left, right)
-                return left**right
-            case ComplexTokenType.GREATER:
-                self._numeric_validation(expr.operator, left, right)
-                return left > right
-            case ComplexTokenType.GREATER_EQUAL:
-                self._numeric_validation(expr.operator, left, right)
-                return left >= right
-            case ComplexTokenType.LESS:
-                self._numeric_validation(expr.operator, left, right)
-                return left < right
-            case ComplexTokenType.LESS_EQUAL:
-                self._numeric_validation(expr.operator, left, right)
-                return left <= right
-            case ComplexTokenType.BANG_EQUAL:
-                return not self.is_equal(left, right)
-            case ComplexTokenType.EQUAL_EQUAL:
-                return self.is_equal(left, right)
-            case _:
-                raise PyLoxRuntimeError(
-                    self.error(expr.operator, f"Unexpected binary operator {expr.operator.lexeme}.")
-                )
+        handler = _BINARY_OPS.get(expr.operator.token_type)
+        if handler is None:
+            raise PyLoxRuntimeError(self.error(expr.operator, f"Unexpected binary operator {expr.operator.lexeme}."))
+        return handler(self, expr.operator, left, right)
 
     def visit_call_expr(self, expr: "Call") -> t.Any:
         """Visit a call expression."""
-        callee: t.Any = self._evaluate(expr.callee)
-        arguments: t.List[t.Any] = [self._evaluate(arg) for arg in expr.arguments]
+        evaluate = self._evaluate
+        callee: t.Any = evaluate(expr.callee)
+        args = expr.arguments
+        count = len(args)
+        if count == 0:
+            arguments: t.List[t.Any] = []
+        elif count == 1:
+            arguments = [evaluate(args[0])]
+        elif count == 2:
+            arguments = [evaluate(args[0]), evaluate(args[1])]
+        else:
+            arguments = [evaluate(arg) for arg in args]
         if not isinstance(callee, LoxCallable):
             raise PyLoxRuntimeError(self.error(expr.paren, "Can only call functions and classes."))
-        if len(arguments) != callee.arity:
-            raise PyLoxRuntimeError(
-                self.error(expr.paren, f"Expected {callee.arity} arguments but got {len(arguments)}")
-            )
+        if count != callee.arity:
+            raise PyLoxRuntimeError(self.error(expr.paren, f"Expected {callee.arity} arguments but got {count}"))
         try:
-            return callee(self, arguments)
+            return _converter(callee(self, arguments))
         except Exception as e:
             self._logger.error(
                 f"Error calling function {expr.paren.line  - self._lox._process.lines}:{expr.paren.column}:\n{e}"
@@ -414,18 +535,44 @@ class Interpreter(VisitorProtocol, StmtProtocol):
     def visit_get_expr(self, expr: "Get") -> t.Any:
         """Visit a get expression."""
         obj: t.Any = self._evaluate(expr.object)
+        if type(obj) is LoxInstance:
+            # Inline LoxInstance.get with a monomorphic method cache on the
+            # node; fields are checked first since they shadow methods.
+            lexeme = expr.name.lexeme
+            value = obj.fields.get(lexeme, _MISSING)
+            if value is not _MISSING:
+                return value
+            bound = obj._bound.get(lexeme)
+            if bound is not None:
+                return bound
+            parent = obj.parent
+            cached = expr._cache
+            if cached is not None and cached[0] is parent:
+                method = cached[1]
+            else:
+                method = parent.find_method(lexeme)
+                if method is None:
+                    raise PyLoxRuntimeError(f"Undefined property '{lexeme}'.")
+                expr._cache = (parent, method)
+            bound = method.bind(obj)
+            obj._bound[lexeme] = bound
+            return bound
         if isinstance(obj, LoxInstance):
             return obj.get(expr.name)
         raise PyLoxRuntimeError(self.error(expr.name, "Only instances have properties."))
 
     def visit_super_expr(self, expr: "Super") -> t.Any:
         """Visit a super expression."""
-        distance: int = self._locals.get(expr, 0)
+        distance: int = max(expr._depth, 0)
         superclass: LoxClass = self._environment.get_at(distance, "super")
         obj: LoxInstance = self._environment.get_at(distance - 1, "this")
+        resolved = expr._resolved
+        if resolved is not None and resolved[0] is superclass:
+            return resolved[1].bind(obj)
         method: LoxFunction | None = superclass.find_method(expr.method.lexeme)
         if method is None:
             raise PyLoxRuntimeError(self.error(expr.method, f"Undefined property {expr.method.lexeme}."))
+        expr._resolved = (superclass, method)
         return method.bind(obj)
 
     def visit_throw_stmt(self, stmt: "Throw") -> t.Any:
@@ -2,7 +2,7 @@ import enum
 import typing as t
 
 from src.exceptions import PyLoxResolutionError
-from src.utils.protocol import StmtProtocol, VisitorProtocol
+from src.utils.protocol import StmtProtocol, VisitorBase, VisitorProtocol
 
 if t.TYPE_CHECKING:
     from src.lexer.tokens import Token
@@ -59,10 +59,17 @@ class LoopyType(enum.Enum):
     WHILE = enum.auto()
 
 
+_FT_NONE = FunctionType.NONE
+_FT_INITIALIZER = FunctionType.INITIALIZER
+_CT_NONE = ClassType.NONE
+_CT_SUBCLASS = ClassType.SUBCLASS
+_LT_NONE = LoopyType.NONE
+
+
 __all__: tuple[str, ...] = ("Resolver",)
 
 
-class Resolver(StmtProtocol, VisitorProtocol):
+class Resolver(VisitorBase, StmtProtocol, VisitorProtocol):
     """Resolve names in the AST.
 
     For example, the following code is valid:
@@ -85,19 +92,36 @@ class Resolver(StmtProtocol, VisitorProtocol):
 
     def __init__(self, interpreter: "Interpreter") -> None:
         self._interpreter = interpreter
+        self._dispatch = self._bind_dispatch()
         self.scopes: list[dict[str, bool]] = []
         self.current_function: FunctionType = FunctionType.NONE
         self.current_class: ClassType = ClassType.NONE
         self.current_loop: LoopyType = LoopyType.NONE
+        self._name_stack: dict[str, list[int]] = {}
+        self._scope_names: list[list[str]] = []
+        self._scope_pool: list[dict[str, bool]] = []
 
     def _begin_scope(self) -> None:
-        self.scopes.append({})
+        self.scopes.append(self._scope_pool.pop() if self._scope_pool else {})
+        self._scope_names.append([])
 
     def _end_scope(self) -> None:
-        self.scopes.pop()
+        scope = self.scopes.pop()
+        scope.clear()
+        self._scope_pool.append(scope)
+        for name in self._scope_names.pop():
+            stack = self._name_stack[name]
+            stack.pop()
+            if not stack:
+                del self._name_stack[name]
+
+    def _add_name(self, lexeme: str) -> None:
+        """Record a declaration in the name->depth index used by _resolve_local."""
+        self._name_stack.setdefault(lexeme, []).append(len(self.scopes) - 1)
+        self._scope_names[-1].append(lexeme)
 
     def _resolve_one(self, expr: t.Union["Stmt", "Expr"]) -> None:
-        expr.accept(self)
+        self._dispatch[type(expr)](expr)
 
     def _resolve(self, statements: t.Sequence[t.Union["Stmt", "Expr"]]) -> None:
         try:
@@ -108,10 +132,9 @@ class Resolver(StmtProtocol, VisitorProtocol):
             raise e
 
     def _resolve_local(self, expr: "Expr", name: "Token") -> None:
-        for i, scope in enumerate(reversed(self.scopes)):
-            if name.lexeme in scope:
-                self._interpreter._resolve(expr, i)
-                return
+        stack = self._name_stack.get(name.lexeme)
+        if stack:
+            self._interpreter._resolve(expr, len(self.scopes) - 1 - stack[-1])
 
     def _resolve_function(self, function: t.Union["Function", "Lambda"], type_: FunctionType) -> None:
         enclosing_function = self.current_function
@@ -136,6 +159,7 @@ class Resolver(StmtProtocol, VisitorProtocol):
                 self._interpreter.error(name, f"Variable '{name.lexeme}' already declared in this scope.")
             )
         scope[name.lexeme] = False
+        self._add_name(name.lexeme)
 
     def _define(self, name: "Token") -> None:
         if not self.scopes:
@@ -162,8 +186,10 @@ class Resolver(StmtProtocol, VisitorProtocol):
             self._resolve_one(stmt.superclass)
             self._begin_scope()
             self.scopes[-1]["super"] = True
+            self._add_name("super")
         self._begin_scope()
         self.scopes[-1]["this"] = True
+        self._add_name("this")
         for method in stmt.methods:
             declaration = FunctionType.METHOD
             if method.name.lexeme == "init":
@@ -225,10 +251,10 @@ class Resolver(StmtProtocol, VisitorProtocol):
         return None
 
     def visit_return_stmt(self, stmt: "Return") -> t.Any:
-        if self.current_function == FunctionType.NONE:
+        if self.current_function is _FT_NONE:
             raise PyLoxResolutionError(self._interpreter.error(stmt.keyword, "Cannot return from top-level code."))
         if stmt.value is not None:
-            if self.current_function == FunctionType.INITIALIZER:
+            if self.current_function is _FT_INITIALIZER:
                 raise PyLoxResolutionError(
                     self._interpreter.error(stmt.keyword, "Cannot return a value from an initializer.")
                 )
@@ -252,12 +278,12 @@ class Resolver(StmtProtocol, VisitorProtocol):
         return None
 
     def visit_break_stmt(self, stmt: "Break") -> t.Any:
-        if self.current_loop == LoopyType.NONE:
+        if self.current_loop is _LT_NONE:
             raise PyLoxResolutionError(self._interpreter.error(stmt.keyword, "Cannot break outside of a loop."))
         return None
 
     def visit_continue_stmt(self, stmt: "Continue") -> t.Any:
-        if self.current_loop == LoopyType.NONE:
+        if self.current_loop is _LT_NONE:
             raise PyLoxResolutionError(self._interpreter.error(stmt.keyword, "Cannot continue outside of a loop."))
         return None
 
@@ -294,9 +320,9 @@ class Resolver(StmtProtocol, VisitorProtocol):
         return None
 
     def visit_super_expr(self, expr: "Super") -> t.Any:
-        if self.current_class == ClassType.NONE:
+        if self.current_class is _CT_NONE:
             raise PyLoxResolutionError(self._interpreter.error(expr.keyword, "Cannot use 'super' outside of a class."))
-        elif self.current_class != ClassType.SUBCLASS:
+        elif self.current_class is not _CT_SUBCLASS:
             raise PyLoxResolutionError(
                 self._interpreter.error(expr.keyword, "Cannot use 'super' in a class with no superclass.")
             )
@@ -304,7 +330,7 @@ class Resolver(StmtProtocol, VisitorProtocol):
         return None
 
     def visit_this_expr(self, expr: "This") -> t.Any:
-        if self.current_class == ClassType.NONE:
+        if self.current_class is _CT_NONE:
             raise PyLoxResolutionError(self._interpreter.error(expr.keyword, "Cannot use 'this' outside of a class."))
         self._resolve_local(expr, expr.keyword)
 
@@ -1,3 +1,4 @@
+import re
 import typing as t
 
 from src.exceptions import PyLoxSyntaxError, PyLoxValueError
@@ -21,12 +22,71 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("Lexer",)
 
 
+_MISC_CHARS = frozenset(str(misc) for misc in MiscTokenType)
+_COMPLEX_CHARS = frozenset(str(complex_) for complex_ in ComplexTokenType)
+_SIMPLE_CHARS = frozenset(str(simple) for simple in SimpleTokenType)
+
+_IDENT_RE = re.compile(r"\w*")
+_NUMBER_RE = re.compile(r"[0-9]*(?:\.[0-9]+)?")
+
+_SIMPLE = {str(simple): simple for simple in SimpleTokenType}
+_COMPLEX = {str(complex_): complex_ for complex_ in ComplexTokenType}
+_KW = {str(keyword): keyword for keyword in KeywordTokenType}
+
+_SLASH = str(SimpleTokenType.SLASH)
+_STAR = str(SimpleTokenType.STAR)
+_EQUAL = str(ComplexTokenType.EQUAL)
+_BACKSLASH = str(ComplexTokenType.BACKSLASH)
+
+
 class Lexer:
     def __init__(self, source: str, logger: "Logger") -> None:
         self._source = source
         self._tokens: list[Token] = []
         self._cursor = Cursor(source=self._source)
         self._logger = logger
+        self._dispatch = self._build_dispatch()
+
+    def _build_dispatch(self) -> list[t.Optional[t.Callable[[str], None]]]:
+        """Build the per-character handler table for ASCII source characters."""
+        dispatch: list[t.Optional[t.Callable[[str], None]]] = [None] * 128
+        for letter in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+            dispatch[ord(letter)] = self._handle_identifier
+        for digit in "0123456789":
+            dispatch[ord(digit)] = self._handle_number
+        for simple in _SIMPLE_CHARS:
+            dispatch[ord(simple)] = self._handle_simple
+        for complex_ in _COMPLEX_CHARS:
+            if len(complex_) == 1:
+                dispatch[ord(complex_)] = self._read_complex
+        dispatch[ord(str(SimpleTokenType.SLASH))] = self._handle_comment
+        for misc in _MISC_CHARS:
+            dispatch[ord(misc)] = self._handle_skip
+        dispatch[ord("\n")] = self._handle_newline
+        dispatch[ord(str(LiteralTokenType.SINGLE_QUOTE))] = self._handle_string
+        dispatch[ord(str(LiteralTokenType.DOUBLE_QUOTE))] = self._handle_string
+        return dispatch
+
+    def _handle_skip(self, char: str) -> None:
+        return
+
+    def _handle_newline(self, char: str) -> None:
+        self._cursor.bump_line()
+
+    def _handle_simple(self, char: str) -> None:
+        self._add_token(_SIMPLE[char])
+
+    def _handle_comment(self, char: str) -> None:
+        self._read_comment()
+
+    def _handle_string(self, char: str) -> None:
+        self._read_string(char)
+
+    def _handle_identifier(self, char: str) -> None:
+        self._read_identifier()
+
+    def _handle_number(self, char: str) -> None:
+        self._read_number()
 
     def _add_token(self, token_type: TokenType, literal: t.Any = None) -> None:
         """Add a token to the list of tokens."""
@@ -34,96 +94,103 @@ class Lexer:
 
     def _read_string(self, terminator: str = '"') -> None:
         """Read a string."""
-        while self._cursor.peek() != terminator and not self._cursor.at_end:
-            if self._cursor.peek() == "\n":
-                self._cursor.bump_line()
-            self._cursor.advance()
-        if self._cursor.at_end:
-            self._logger.error(self._cursor.error_highlight("Unterminated string."))
-            raise PyLoxValueError(self._cursor.error_highlight("Unterminated string."))
-        self._cursor.advance()
-        value = self._cursor.source[self._cursor.start + 1 : self._cursor.current - 1]
-        self._add_token(LiteralTokenType.STRING, value)
+        cursor = self._cursor
+        source = cursor.source
+        index = source.find(terminator, cursor.current)
+        if index == -1:
+            while not cursor.at_end:
+                if cursor.peek() == "\n":
+                    cursor.bump_line()
+                cursor.advance()
+            self._logger.error(cursor.error_highlight("Unterminated string."))
+            raise PyLoxValueError(cursor.error_highlight("Unterminated string."))
+        newlines = source.count("\n", cursor.current, index)
+        if newlines:
+            cursor.line += newlines
+            cursor.column = index + 2 - source.rindex("\n", cursor.current, index)
+        else:
+            cursor.column += index + 1 - cursor.current
+        cursor.current = index + 1
+        self._add_token(LiteralTokenType.STRING, source[cursor.start + 1 : index])
 
     def _read_identifier(self) -> None:
         """Read an identifier."""
-        while self._cursor.peek().isalnum() or self._cursor.peek() == "_":
-            self._cursor.advance()
-        value = self._cursor.source[self._cursor.start : self._cursor.current]
-        _ids = [i.lexeme for i in self._tokens if i.token_type == LiteralTokenType.IDENTIFIER]
-        if value in KeywordTokenType.as_dict().values():
-            self._add_token(KeywordTokenType(value))
+        cursor = self._cursor
+        match = _IDENT_RE.match(cursor.source, cursor.current)
+        assert match is not None
+        end = match.end()
+        cursor.column += end - cursor.current
+        cursor.current = end
+        value = cursor.source[cursor.start : end]
+        keyword = _KW.get(value)
+        if keyword is not None:
+            self._add_token(keyword)
         else:
             self._add_token(LiteralTokenType.IDENTIFIER, value)
 
     def _read_number(self) -> None:
         """Read a number."""
-        while self._cursor.peek().isdigit():
-            self._cursor.advance()
-        is_float = False
-        if self._cursor.peek() == "." and self._cursor.peek(offset=1).isdigit():
-            is_float = True
-            self._cursor.advance()
-            while self._cursor.peek().isdigit():
-                self._cursor.advance()
-        value = self._cursor.source[self._cursor.start : self._cursor.current]
-        self._add_token(LiteralTokenType.NUMBER, float(value) if is_float else int(value))
+        cursor = self._cursor
+        match = _NUMBER_RE.match(cursor.source, cursor.current)
+        assert match is not None
+        end = match.end()
+        cursor.column += end - cursor.current
+        cursor.current = end
+        value = cursor.source[cursor.start : end]
+        self._add_token(LiteralTokenType.NUMBER, float(value) if "." in value else int(value))
 
     def _read_comment(self) -> None:
         """Read a comment."""
-        if self._cursor.match(str(SimpleTokenType.SLASH)):
-            while self._cursor.peek() != "\n" and not self._cursor.at_end:
-                self._cursor.advance()
-        elif self._cursor.match(str(SimpleTokenType.STAR)):
-            while not self._cursor.at_end and not (
-                self._cursor.match(str(SimpleTokenType.STAR)) and self._cursor.match(str(SimpleTokenType.SLASH))
-            ):
-                if self._cursor.peek() == "\n":
-                    self._cursor.bump_line()
-                self._cursor.advance()
-            if self._cursor.at_end:
-                self._logger.error(self._cursor.error_highlight("Unterminated comment."))
-                raise PyLoxSyntaxError(self._cursor.error_highlight("Unterminated comment."))
+        cursor = self._cursor
+        if cursor.match(_SLASH):
+            while cursor.peek() != "\n" and not cursor.at_end:
+                cursor.advance()
+        elif cursor.match(_STAR):
+            while not cursor.at_end and not (cursor.match(_STAR) and cursor.match(_SLASH)):
+                if cursor.peek() == "\n":
+                    cursor.bump_line()
+                cursor.advance()
+            if cursor.at_end:
+                self._logger.error(cursor.error_highlight("Unterminated comment."))
+                raise PyLoxSyntaxError(cursor.error_highlight("Unterminated comment."))
         else:
             self._add_token(SimpleTokenType.SLASH)
 
     def _read_complex(self, char: str) -> None:
-        if self._cursor.match(str(ComplexTokenType.EQUAL)):
-            self._add_token(ComplexTokenType(f"{char}{str(ComplexTokenType.EQUAL)}"))
-        elif self._cursor.match(str(ComplexTokenType.BACKSLASH)) and char == str(ComplexTokenType.BACKSLASH):
-            self._add_token(ComplexTokenType(char))
+        cursor = self._cursor
+        if cursor.match(_EQUAL):
+            self._add_token(_COMPLEX[char + _EQUAL])
+        elif cursor.match(_BACKSLASH) and char == _BACKSLASH:
+            self._add_token(_COMPLEX[char])
         else:
-            self._add_token(ComplexTokenType(char))
+            self._add_token(_COMPLEX[char])
 
     def _scan_token(self) -> None:
         """Scan the source file for a token."""
         char = self._cursor.advance()
-        if char in MiscTokenType.as_dict().values():
-            return
-        elif char == str(SimpleTokenType.SLASH):
-            self._read_comment()
-        elif char in ComplexTokenType.as_dict().values():
-            self._read_complex(char)
-        elif char in SimpleTokenType.as_dict().values():
-            self._add_token(SimpleTokenType(char))
-        elif char == "\n":
-            self._cursor.bump_line()
-        elif char in (str(LiteralTokenType.SINGLE_QUOTE), str(LiteralTokenType.DOUBLE_QUOTE)):
-            self._read_string(LiteralTokenType(char))
-        elif char.isalpha() or char == "_":
+        code = ord(char)
+        if code < 128:
+            handler = self._dispatch[code]
+            if handler is not None:
+                handler(char)
+                return
+        elif char.isalpha():
             self._read_identifier()
+            return
         elif char.isdigit():
             self._read_number()
-        else:
-            self._logger.error(self._cursor.error_highlight(f"Unexpected character '{char}'."))
-            raise PyLoxSyntaxError(self._cursor.error_highlight(f"Unexpected character '{char}'."))
+            return
+        self._logger.error(self._cursor.error_highlight(f"Unexpected character '{char}'."))
+        raise PyLoxSyntaxError(self._cursor.error_highlight(f"Unexpected character '{char}'."))
 
     def scan_tokens(self) -> list[Token]:
         """Scan the source file for tokens."""
-        while not self._cursor.at_end:
-            self._cursor.start = self._cursor.current
-            self._scan_token()
-        eof_ = Token.from_raw(EOFTokenType.EOF, self._cursor)
+        cursor = self._cursor
+        scan = self._scan_token
+        while not cursor.at_end:
+            cursor.start = cursor.current
+            scan()
+        eof_ = Token.from_raw(EOFTokenType.EOF, cursor)
         self._tokens.append(eof_)
         return self._tokens
 
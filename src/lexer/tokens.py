@@ -1,5 +1,6 @@
 import dataclasses
 import enum
+import sys
 import typing as t
 
 if t.TYPE_CHECKING:
@@ -18,13 +19,19 @@ __all__: tuple[str, ...] = (
 )
 
 
+_AS_DICT_CACHE: dict[type, dict[str, str]] = {}
+
+
 class TokenType(enum.StrEnum):
     """Base class for token types."""
 
     @classmethod
     def as_dict(cls) -> dict[str, str]:
         """Return a dictionary of the enum values."""
-        return {key: str(value) for key, value in cls.__members__.items()}
+        cached = _AS_DICT_CACHE.get(cls)
+        if cached is None:
+            cached = _AS_DICT_CACHE[cls] = {key: str(value) for key, value in cls.__members__.items()}
+        return cached
 
 
 class SimpleTokenType(TokenType):
@@ -101,7 +108,7 @@ class MiscTokenType(TokenType):
     LF = "\r"
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Token:
     token_type: TokenType
     lexeme: str
@@ -115,9 +122,12 @@ class Token:
     @classmethod
     def from_raw(cls, token: TokenType, cursor: "Cursor", literal: t.Optional[str] = None) -> "Token":
         """Create a token from a raw character."""
+        lexeme = cursor.source[cursor.start : cursor.current]
+        if token is LiteralTokenType.IDENTIFIER or isinstance(token, KeywordTokenType):
+            lexeme = sys.intern(lexeme)
         return cls(
             token_type=token,
-            lexeme=cursor.source[cursor.start : cursor.current],
+            lexeme=lexeme,
             literal=literal,
             line=cursor.line,
             column=cursor.column,
@@ -30,37 +30,54 @@ class RelativePathFilter(logging.Filter):
 
 
 class Formatter(logging.Formatter):
+    _colors: t.ClassVar[dict[int, str]] = {
+        logging.DEBUG: LogLevelColors.DEBUG.value,
+        logging.INFO: LogLevelColors.INFO.value,
+        logging.WARNING: LogLevelColors.WARNING.value,
+        logging.ERROR: LogLevelColors.ERROR.value,
+        logging.CRITICAL: LogLevelColors.CRITICAL.value,
+        FLAIR: LogLevelColors.FLAIR.value,
+    }
+    _end: t.ClassVar[str] = LogLevelColors.ENDC.value
+
     def __init__(self) -> None:
         super().__init__(
-            "[%(asctime)s] | %(pathname)s:%(lineno)d | %(levelname)s | %(message)s",
+            "[{asctime}] | {pathname}:{lineno} | {levelname} | {message}",
+            style="{",
         )
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record."""
-        color, end = LogLevelColors.ENDC.value, LogLevelColors.ENDC.value
-        return f"{color}{super().format(record)}{end}"
+        return f"{self._colors.get(record.levelno, self._end)}{super().format(record)}{self._end}"
 
 
 class FileHandler(logging.FileHandler):
-    _last_entry: datetime.datetime = datetime.datetime.today()
-
     def __init__(self, *, ext: str, folder: pathlib.Path | str = "logs") -> None:
         """Create a new file handler."""
         self.folder = pathlib.Path(folder)
         self.ext = ext
         self.folder.mkdir(exist_ok=True)
+        today = datetime.datetime.today()
         super().__init__(
-            self.folder / f"{datetime.datetime.today().strftime('%Y-%m-%d')}_log.{ext}",
+            self.folder / f"{today.strftime('%Y-%m-%d')}_log.{ext}",
             encoding="utf-8",
         )
+        self._next_rollover = self._midnight_after(today)
+
+    @staticmethod
+    def _midnight_after(moment: datetime.datetime) -> float:
+        """Return the timestamp of the midnight following the given moment."""
+        midnight = (moment + datetime.timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+        return midnight.timestamp()
 
     def emit(self, record: logging.LogRecord) -> None:
         """Emit a log record."""
-        if self._last_entry.date() != datetime.datetime.today().date():
-            self._last_entry = datetime.datetime.today()
+        if record.created >= self._next_rollover:
+            day = datetime.datetime.fromtimestamp(record.created)
             self.close()
-            self.baseFilename = (self.folder / f"{self._last_entry.strftime('%Y-%m-%d')}_log.{self.ext}").as_posix()
+            self.baseFilename = (self.folder / f"{day.strftime('%Y-%m-%d')}_log.{self.ext}").as_posix()
             self.stream = self._open()
+            self._next_rollover = self._midnight_after(day)
         super().emit(record)
 
 
@@ -1,6 +1,7 @@
 import typing as t
 
 from src.exceptions import PyLoxParseError
+from src.internals.string import LoxString
 from src.lexer.tokens import ComplexTokenType, EOFTokenType, KeywordTokenType, LiteralTokenType, SimpleTokenType
 from src.utils.expr import (
     Assign,
@@ -42,15 +43,125 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("Parser",)
 
 
+_SYNC_TOKENS = frozenset(
+    {
+        KeywordTokenType.CLASS,
+        KeywordTokenType.FUN,
+        KeywordTokenType.VAR,
+        KeywordTokenType.FOR,
+        KeywordTokenType.IF,
+        KeywordTokenType.WHILE,
+        KeywordTokenType.PRINT,
+        KeywordTokenType.RETURN,
+        KeywordTokenType.THROW,
+    }
+)
+
+# Memo-table tags for the opt-in packrat cache; keyed with the token position.
+_MEMO_CALL, _MEMO_PRIMARY = 0, 1
+
+_BINARY_PRECEDENCE: dict[t.Any, int] = {
+    KeywordTokenType.OR: 1,
+    KeywordTokenType.AND: 2,
+    ComplexTokenType.BANG_EQUAL: 3,
+    ComplexTokenType.EQUAL_EQUAL: 3,
+    ComplexTokenType.GREATER: 4,
+    ComplexTokenType.GREATER_EQUAL: 4,
+    ComplexTokenType.LESS: 4,
+    ComplexTokenType.LESS_EQUAL: 4,
+    SimpleTokenType.MINUS: 5,
+    SimpleTokenType.PLUS: 5,
+    SimpleTokenType.CARAT: 6,
+    SimpleTokenType.SLASH: 6,
+    ComplexTokenType.BACKSLASH: 6,
+    SimpleTokenType.STAR: 6,
+    SimpleTokenType.MODULO: 6,
+}
+
+_FOLD_OPS: dict[t.Any, t.Callable[[t.Any, t.Any], t.Any]] = {
+    SimpleTokenType.PLUS: lambda left, right: left + right,
+    SimpleTokenType.MINUS: lambda left, right: left - right,
+    SimpleTokenType.STAR: lambda left, right: left * right,
+    SimpleTokenType.SLASH: lambda left, right: left / right,
+    ComplexTokenType.BACKSLASH: lambda left, right: left // right,
+    SimpleTokenType.MODULO: lambda left, right: left % right,
+    SimpleTokenType.CARAT: lambda left, right: left**right,
+}
+
+
+class _LazyParseError(PyLoxParseError):
+    """Parse error that defers building the underline diagnostic until it is printed."""
+
+    def __init__(self, token: "Token", error: str, message: str, line_lookup: t.Callable[[int], str]) -> None:
+        super().__init__(error)
+        self._token = token
+        self._error = error
+        self._detail = message
+        self._line_lookup = line_lookup
+
+    def __str__(self) -> str:
+        token = self._token
+        line = self._line_lookup(token.line)
+        return f"{self.error_type.name}: {self._error}\n{self._detail}\n{line}\n{'~' * (token.column - 1)}^"
+
+
+_LIT_FALSE = Literal(False)
+_LIT_TRUE = Literal(True)
+_LIT_NIL = Literal(None)
+_INT_LITERALS = {value: Literal(value) for value in range(-5, 257)}
+
+
+def _make_literal(value: t.Any) -> Literal:
+    """Return a shared Literal for booleans, nil, and small ints; a fresh node otherwise."""
+    if value is None:
+        return _LIT_NIL
+    if value is True:
+        return _LIT_TRUE
+    if value is False:
+        return _LIT_FALSE
+    if type(value) is int and -5 <= value <= 256:
+        return _INT_LITERALS[value]
+    return Literal(value)
+
+
+def _fold_binary(left: Expr, operator: "Token", right: Expr) -> Expr:
+    """Fold arithmetic on two numeric literals at parse time; division by zero is left to the runtime."""
+    if type(left) is Literal and type(right) is Literal:
+        left_value, right_value = left.value, right.value
+        if (type(left_value) is int or type(left_value) is float) and (
+            type(right_value) is int or type(right_value) is float
+        ):
+            fold = _FOLD_OPS.get(operator.token_type)
+            if fold is not None:
+                try:
+                    return _make_literal(fold(left_value, right_value))
+                except ZeroDivisionError:
+                    pass
+    return Binary(left, operator, right)
+
+
 class Parser:
-    def __init__(self, lox: "PyLox", tokens: list["Token"], logger: "Logger", source: str, debug: bool = True) -> None:
+    def __init__(
+        self,
+        lox: "PyLox",
+        tokens: list["Token"],
+        logger: "Logger",
+        source: str,
+        debug: bool = True,
+        packrat: bool = False,
+    ) -> None:
         self._tokens = tokens
+        self._token_types = [token.token_type for token in tokens]
         self._current = 0
         self._logger = logger
         self._debug = debug
         self._source = source
+        self._line_starts: t.Optional[list[int]] = None
         self._has_error = False
         self._lox = lox
+        # Opt-in: memoizing every rule is usually slower than plain descent,
+        # so only _call/_primary participate and only when asked for.
+        self._memo: t.Optional[dict[tuple[int, int], tuple[t.Any, int]]] = {} if packrat else None
 
     def parse(self) -> list["Stmt"]:
         """Parse the tokens."""
@@ -70,7 +181,7 @@ class Parser:
 
     def _is_at_end(self) -> bool:
         """Check if the parser is at the end of the tokens."""
-        return isinstance(self._peek().token_type, EOFTokenType)
+        return self._token_types[self._current] is EOFTokenType.EOF
 
     def _advance(self) -> "Token":
         """Advance the parser."""
@@ -80,9 +191,8 @@ class Parser:
 
     def _check(self, token_type: "TokenType") -> bool:
         """Check if the current token is of a certain type."""
-        if self._is_at_end():
-            return False
-        return self._peek().token_type == token_type
+        # No end-of-input guard: the EOF sentinel never equals a checked type.
+        return self._token_types[self._current] == token_type
 
     def _match(self, *token_types: "TokenType") -> bool:
         """Check if the current token is of any of the given types."""
@@ -92,11 +202,31 @@ class Parser:
                 return True
         return False
 
+    def _match1(self, token_type: "TokenType") -> bool:
+        """Match a single token type without packing a vararg tuple."""
+        if self._token_types[self._current] == token_type:
+            self._current += 1
+            return True
+        return False
+
+    def _source_line(self, line_number: int) -> str:
+        """Return one source line by number without splitting the whole source."""
+        starts = self._line_starts
+        if starts is None:
+            starts = self._line_starts = [0]
+            index = self._source.find("\n")
+            while index != -1:
+                starts.append(index + 1)
+                index = self._source.find("\n", index + 1)
+        begin = starts[line_number - 1]
+        end = starts[line_number] - 1 if line_number < len(starts) else len(self._source)
+        return self._source[begin:end]
+
     def _error(self, token: "Token", error: str, message: str) -> None:
-        line = self._source.splitlines()[token.line - 1]
+        exc = _LazyParseError(token, error, message, self._source_line)
         if not self._debug:
-            self._logger.error(f"{error}\n{message}\n{line}\n{'~' * (token.column - 1)}^")
-        raise PyLoxParseError(f"{error}\n{message}\n{line}\n{'~' * (token.column - 1)}^")
+            self._logger.error(exc)
+        raise exc
 
     def _consume(self, token_type: "TokenType", message: str) -> "Token":  # type: ignore
         """Consume a token."""
@@ -115,17 +245,7 @@ class Parser:
         while not self._is_at_end():
             if self._previous().token_type == SimpleTokenType.SEMICOLON:
                 return
-            if self._peek().token_type in (
-                KeywordTokenType.CLASS,
-                KeywordTokenType.FUN,
-                KeywordTokenType.VAR,
-                KeywordTokenType.FOR,
-                KeywordTokenType.IF,
-                KeywordTokenType.WHILE,
-                KeywordTokenType.PRINT,
-                KeywordTokenType.RETURN,
-                KeywordTokenType.THROW,
-            ):
+            if self._peek().token_type in _SYNC_TOKENS:
                 return
             self._advance()
 
@@ -141,12 +261,10 @@ class Parser:
     def _declaration(self) -> Stmt | None:
         """Parse a declaration."""
         try:
-            if self._match(KeywordTokenType.VAR):
-                return self._var_declaration()
-            elif self._match(KeywordTokenType.FUN):
-                return self._function_declaration("function")
-            elif self._match(KeywordTokenType.CLASS):
-                return self._class_declaration()
+            handler = _DECLARATION_DISPATCH.get(self._token_types[self._current])
+            if handler is not None:
+                self._current += 1
+                return handler(self)
             return self._statement()
         except PyLoxParseError as e:
             if self._debug:
@@ -162,7 +280,7 @@ class Parser:
         """
         name = self._consume(LiteralTokenType.IDENTIFIER, "Expected class name.")
         super_class = None
-        if self._match(ComplexTokenType.LESS):
+        if self._match1(ComplexTokenType.LESS):
             self._consume(LiteralTokenType.IDENTIFIER, "Expected superclass name.")
             super_class = Variable(self._previous())
         self._consume(SimpleTokenType.LEFT_BRACE, "Expected '{' before class body.")
@@ -182,18 +300,18 @@ class Parser:
         self._consume(SimpleTokenType.LEFT_PAREN, f"Expected '(' after {kind} name.")
         parameters: list["Token"] = []
         if not self._check(SimpleTokenType.RIGHT_PAREN):
-            while True:
-                if len(parameters) >= 255:
-                    self._error(
-                        self._peek(), "Parse Error", f"Cannot have more than 255 parameters in {kind} {name.lexeme}"
-                    )
+            for _ in range(255):
                 parameters.append(self._consume(LiteralTokenType.IDENTIFIER, "Expected parameter name."))
-                if not self._match(SimpleTokenType.COMMA):
+                if not self._match1(SimpleTokenType.COMMA):
                     break
+            else:
+                self._error(
+                    self._peek(), "Parse Error", f"Cannot have more than 255 parameters in {kind} {name.lexeme}"
+                )
         self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after parameters.")
         self._consume(SimpleTokenType.LEFT_BRACE, f"Expected '{{' before {kind} body.")
         body = self._block()
-        return Function(name, parameters, body)
+        return Function(name, tuple(parameters), body)
 
     def _var_declaration(self) -> Var:
         """
@@ -202,7 +320,7 @@ class Parser:
         """
         name = self._consume(LiteralTokenType.IDENTIFIER, "Expected variable name.")
         initializer = None
-        if self._match(ComplexTokenType.EQUAL):
+        if self._match1(ComplexTokenType.EQUAL):
             initializer = self._assignment()
         self._consume(SimpleTokenType.SEMICOLON, "Expected ';' after variable declaration.")
         return Var(name, initializer)
@@ -212,28 +330,20 @@ class Parser:
         Parse a statement.
         :return: The parsed data
         """
-        if self._match(KeywordTokenType.FOR):
-            return self._for_statement()
-        elif self._match(KeywordTokenType.IF):
-            return self._if_statement()
-        elif self._match(KeywordTokenType.PRINT):
-            return self._print_statement()
-        elif self._match(KeywordTokenType.RETURN):
-            return self._return_statement()
-        elif self._match(KeywordTokenType.WHILE):
-            return self._while_statement()
-        elif self._match(KeywordTokenType.BREAK):
-            return self._break_statement()
-        elif self._match(KeywordTokenType.CONTINUE):
-            return self._continue_statement()
-        elif self._match(KeywordTokenType.THROW):
-            return self._throw_statement()
-        elif self._match(KeywordTokenType.TRY):
-            return self._try_statement()
-        elif self._match(SimpleTokenType.LEFT_BRACE):
-            return Block(self._block())
+        handler = _STATEMENT_DISPATCH.get(self._token_types[self._current])
+        if handler is not None:
+            self._current += 1
+            return handler(self)
         return self._expression_statement()
 
+    def _block_statement(self) -> Stmt:
+        """Parse a braced block as a statement."""
+        statements = self._block()
+        # A one-statement block with no declaration needs no scope of its own.
+        if len(statements) == 1 and type(statements[0]) not in (Var, Class, Function):
+            return statements[0]
+        return Block(statements)
+
     def _try_statement(self) -> Stmt:
         """
         Parse a try statement.
@@ -241,12 +351,12 @@ class Parser:
         """
         try_block = self._statement()
         catch_block, variable, finally_block = None, None, None
-        if self._match(KeywordTokenType.CATCH):
+        if self._match1(KeywordTokenType.CATCH):
             self._consume(SimpleTokenType.LEFT_PAREN, "Expected '(' after 'catch'.")
             variable = self._consume(LiteralTokenType.IDENTIFIER, "Expected catch variable name.")
             self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after catch variable.")
             catch_block = self._statement()
-        if self._match(KeywordTokenType.FINALLY):
+        if self._match1(KeywordTokenType.FINALLY):
             finally_block = self._statement()
         if catch_block is None and finally_block is None:
             self._error(self._previous(), "Parse Error", "Expected 'catch' or 'finally' after 'try'.")
@@ -258,7 +368,7 @@ class Parser:
         :return: The parsed data
         """
         keyword = self._previous()
-        value = Literal(None)
+        value = _LIT_NIL
         if not self._check(SimpleTokenType.SEMICOLON):
             value = self._assignment()
         self._consume(SimpleTokenType.SEMICOLON, "Expected ';' after value.")
@@ -270,9 +380,9 @@ class Parser:
         :return: The parsed data
         """
         self._consume(SimpleTokenType.LEFT_PAREN, "Expected '(' after 'for'.")
-        if self._match(SimpleTokenType.SEMICOLON):
+        if self._match1(SimpleTokenType.SEMICOLON):
             initializer = None
-        elif self._match(KeywordTokenType.VAR):
+        elif self._match1(KeywordTokenType.VAR):
             initializer = self._var_declaration()
         else:
             initializer = self._expression_statement()
@@ -288,7 +398,7 @@ class Parser:
         if increment is not None:
             body = Block([body, Expression(increment)])
         if condition is None:
-            condition = Literal(True)
+            condition = _LIT_TRUE
         body = While(condition, body, for_transformed=True)
         if initializer is not None:
             body = Block([initializer, body])
@@ -304,7 +414,7 @@ class Parser:
         self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after if condition.")
         then_branch = self._statement()
         else_branch = None
-        if self._match(KeywordTokenType.ELSE):
+        if self._match1(KeywordTokenType.ELSE):
             else_branch = self._statement()
         return If(condition, then_branch, else_branch)
 
@@ -372,92 +482,46 @@ class Parser:
         Parse an assignment.
         :return: The parsed data
         """
-        expr = self._or()
-        if self._match(ComplexTokenType.EQUAL):
-            value = self._assignment()
-            if isinstance(expr, Variable):
-                name = expr.name
-                return Assign(name, value)
-            elif isinstance(expr, Get):
-                return Set(expr.object, expr.name, value)
-            self._error(self._previous(), "Invalid assignment target.", "Cannot assign to this expression.")
-        return expr
-
-    def _or(self) -> Expr:
-        """
-        Parse an or expression.
-        :return: The parsed data
-        """
-        expr = self._and()
-        while self._match(KeywordTokenType.OR):
-            operator, right = self._previous(), self._and()
-            expr = Logical(expr, operator, right)
-        return expr
-
-    def _and(self) -> Expr:
-        """
-        Parse an and expression.
-        :return: The parsed data
-        """
-        expr = self._equality()
-        while self._match(KeywordTokenType.AND):
-            operator, right = self._previous(), self._equality()
-            expr = Logical(expr, operator, right)
-        return expr
-
-    def _equality(self) -> Expr:
-        """
-        Parse an equality expression.
-        :return: The parsed data
-        """
-        expr = self._comparison()
-        while self._match(ComplexTokenType.BANG_EQUAL, ComplexTokenType.EQUAL_EQUAL):
-            operator, right = self._previous(), self._comparison()
-            expr = Binary(expr, operator, right)
-        return expr
-
-    def _comparison(self) -> Expr:
-        """
-        Parse a comparison expression.
-        :return: The parsed data
-        """
-        expr = self._term()
-        while self._match(
-            ComplexTokenType.GREATER, ComplexTokenType.GREATER_EQUAL, ComplexTokenType.LESS, ComplexTokenType.LESS_EQUAL
-        ):
-            operator, right = self._previous(), self._term()
-            expr = Binary(expr, operator, right)
-        return expr
-
-    def _term(self) -> Expr:
-        """
-        Parse a term expression.
-        :return: The parsed data
-        """
-        expr = self._factor()
-        while self._match(
-            SimpleTokenType.MINUS, SimpleTokenType.PLUS
-        ):  # if there is an term operator parse the right hand side
-            operator, right = self._previous(), self._factor()
-            expr = Binary(expr, operator, right)
-        return expr
+        expr = self._binary_expression()
+        if not self._match1(ComplexTokenType.EQUAL):
+            return expr
+        targets = [expr]
+        while True:
+            right = self._binary_expression()
+            if self._match1(ComplexTokenType.EQUAL):
+                targets.append(right)
+            else:
+                value = right
+                break
+        for target in reversed(targets):
+            if isinstance(target, Variable):
+                value = Assign(target.name, value)
+            elif isinstance(target, Get):
+                value = Set(target.object, target.name, value)
+            else:
+                self._error(self._previous(), "Invalid assignment target.", "Cannot assign to this expression.")
+        return value
 
-    def _factor(self) -> Expr:
+    def _binary_expression(self, min_precedence: int = 1) -> Expr:
         """
-        Parse a factor expression.
+        Parse logical and binary operator chains with one precedence-table loop.
+        :param min_precedence: The lowest operator precedence this call may consume.
         :return: The parsed data
         """
         expr = self._unary()
-        while self._match(
-            SimpleTokenType.CARAT,
-            SimpleTokenType.SLASH,
-            ComplexTokenType.BACKSLASH,
-            SimpleTokenType.STAR,
-            SimpleTokenType.MODULO,
-        ):
-            operator, right = self._previous(), self._unary()
-            expr = Binary(expr, operator, right)
-        return expr
+        while True:
+            precedence = _BINARY_PRECEDENCE.get(self._token_types[self._current])
+            if precedence is None or precedence < min_precedence:
+                return expr
+            self._current += 1
+            operator = self._tokens[self._current - 1]
+            right = self._binary_expression(precedence + 1)
+            if precedence <= 2:
+                expr = Logical(expr, operator, right)
+            elif precedence >= 5:
+                expr = _fold_binary(expr, operator, right)
+            else:
+                expr = Binary(expr, operator, right)
 
     def _unary(self) -> Expr:
         """
@@ -466,6 +530,12 @@ class Parser:
         """
         if self._match(SimpleTokenType.BANG, SimpleTokenType.MINUS):
             operator, right = self._previous(), self._unary()
+            if (
+                operator.token_type is SimpleTokenType.MINUS
+                and type(right) is Literal
+                and (type(right.value) is int or type(right.value) is float)
+            ):
+                return _make_literal(-right.value)
             return Unary(operator, right)
         return self._call()
 
@@ -474,16 +544,24 @@ class Parser:
         Parse a call expression.
         :return: The parsed data
         """
+        memo = self._memo
+        if memo is not None:
+            key = (_MEMO_CALL, self._current)
+            hit = memo.get(key)
+            if hit is not None:
+                expr, self._current = hit
+                return expr
         expr = self._primary()
-        assert isinstance(expr, Expr)
         while True:
-            if self._match(SimpleTokenType.LEFT_PAREN):
+            if self._match1(SimpleTokenType.LEFT_PAREN):
                 expr = self._finish_call(expr)
-            elif self._match(SimpleTokenType.DOT):
+            elif self._match1(SimpleTokenType.DOT):
                 name = self._consume(LiteralTokenType.IDENTIFIER, "Expected property name after '.'.")
                 expr = Get(expr, name)
             else:
                 break
+        if memo is not None:
+            memo[key] = (expr, self._current)
         return expr
 
     def _finish_call(self, callee: Expr) -> Expr:
@@ -494,12 +572,12 @@ class Parser:
         """
         arguments: list[Expr] = []
         if not self._check(SimpleTokenType.RIGHT_PAREN):
-            while True:
-                if len(arguments) >= 255:
-                    self._error(self._peek(), "Cannot have more than 255 arguments.", "\n")
+            for _ in range(255):
                 arguments.append(self._assignment())
-                if not self._match(SimpleTokenType.COMMA):
+                if not self._match1(SimpleTokenType.COMMA):
                     break
+            else:
+                self._error(self._peek(), "Cannot have more than 255 arguments.", "\n")
         paren = self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after arguments.")
         return Call(callee, paren, tuple(arguments))
 
@@ -509,43 +587,98 @@ class Parser:
         :return: The parsed data
         """
         parameters: list[Token] = []
-        while True:
-            if len(parameters) >= 255:
-                self._error(self._peek(), "Cannot have more than 255 parameters.", "\n")
+        for _ in range(255):
             if not self._check(LiteralTokenType.IDENTIFIER):
                 break
             parameters.append(self._advance())
-            if not self._match(SimpleTokenType.COMMA):
+            if not self._match1(SimpleTokenType.COMMA):
                 break
+        else:
+            self._error(self._peek(), "Cannot have more than 255 parameters.", "\n")
         self._consume(SimpleTokenType.COLON, "Expected ':' after lambda parameters.")
-        return Lambda(parameters, [Return(self._previous(), self._assignment())])
+        return Lambda(tuple(parameters), [Return(self._previous(), self._assignment())])
 
     def _primary(self) -> Expr | None:
         """
         Parse a primary expression.
         :return: The parsed data
         """
-        if self._match(KeywordTokenType.LAMBDA):
-            return self._lambda()
-        if self._match(KeywordTokenType.FALSE):
-            return Literal(False)
-        if self._match(KeywordTokenType.TRUE):
-            return Literal(True)
-        if self._match(KeywordTokenType.NIL):
-            return Literal(None)
-        if self._match(LiteralTokenType.NUMBER, LiteralTokenType.STRING):
-            return Literal(self._previous().literal)
-        if self._match(KeywordTokenType.SUPER):
-            keyword = self._previous()
-            self._consume(SimpleTokenType.DOT, "Expected '.' after 'super'.")
-            method = self._consume(LiteralTokenType.IDENTIFIER, "Expected superclass method name.")
-            return Super(keyword, method)
-        if self._match(KeywordTokenType.THIS):
-            return This(self._previous())
-        if self._match(LiteralTokenType.IDENTIFIER):
-            return Variable(self._previous())
-        if self._match(SimpleTokenType.LEFT_PAREN):
-            expr = self._assignment()
-            self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after expression.")
-            return Grouping(expr)
+        memo = self._memo
+        if memo is not None:
+            key = (_MEMO_PRIMARY, self._current)
+            hit = memo.get(key)
+            if hit is not None:
+                expr, self._current = hit
+                return expr
+        handler = _PRIMARY_DISPATCH.get(self._token_types[self._current])
+        if handler is not None:
+            self._current += 1
+            expr = handler(self)
+            if memo is not None:
+                memo[key] = (expr, self._current)
+            return expr
         self._error(self._peek(), f"Expected expression. Got '{self._peek().lexeme}'.", "Invalid expression.")
+
+    def _literal_expression(self) -> Expr:
+        """Parse a number or string literal."""
+        literal = self._previous().literal
+        if type(literal) is str:
+            return Literal(LoxString(literal))
+        return _make_literal(literal)
+
+    def _super_expression(self) -> Expr:
+        """Parse a super expression."""
+        keyword = self._previous()
+        self._consume(SimpleTokenType.DOT, "Expected '.' after 'super'.")
+        method = self._consume(LiteralTokenType.IDENTIFIER, "Expected superclass method name.")
+        return Super(keyword, method)
+
+    def _this_expression(self) -> Expr:
+        """Parse a this expression."""
+        return This(self._previous())
+
+    def _variable_expression(self) -> Expr:
+        """Parse a variable expression."""
+        return Variable(self._previous())
+
+    def _grouping_expression(self) -> Expr:
+        """Parse a parenthesized expression."""
+        expr = self._assignment()
+        self._consume(SimpleTokenType.RIGHT_PAREN, "Expected ')' after expression.")
+        # A parenthesized literal needs no Grouping node; folded operands stay foldable.
+        if type(expr) is Literal:
+            return expr
+        return Grouping(expr)
+
+
+_DECLARATION_DISPATCH: dict[t.Any, t.Callable[[Parser], t.Optional[Stmt]]] = {
+    KeywordTokenType.VAR: Parser._var_declaration,
+    KeywordTokenType.FUN: lambda self: self._function_declaration("function"),
+    KeywordTokenType.CLASS: Parser._class_declaration,
+}
+
+_STATEMENT_DISPATCH: dict[t.Any, t.Callable[[Parser], Stmt]] = {
+    KeywordTokenType.FOR: Parser._for_statement,
+    KeywordTokenType.IF: Parser._if_statement,
+    KeywordTokenType.PRINT: Parser._print_statement,
+    KeywordTokenType.RETURN: Parser._return_statement,
+    KeywordTokenType.WHILE: Parser._while_statement,
+    KeywordTokenType.BREAK: Parser._break_statement,
+    KeywordTokenType.CONTINUE: Parser._continue_statement,
+    KeywordTokenType.THROW: Parser._throw_statement,
+    KeywordTokenType.TRY: Parser._try_statement,
+    SimpleTokenType.LEFT_BRACE: Parser._block_statement,
+}
+
+_PRIMARY_DISPATCH: dict[t.Any, t.Callable[[Parser], t.Optional[Expr]]] = {
+    KeywordTokenType.LAMBDA: Parser._lambda,
+    KeywordTokenType.FALSE: lambda self: _LIT_FALSE,
+    KeywordTokenType.TRUE: lambda self: _LIT_TRUE,
+    KeywordTokenType.NIL: lambda self: _LIT_NIL,
+    LiteralTokenType.NUMBER: Parser._literal_expression,
+    LiteralTokenType.STRING: Parser._literal_expression,
+    KeywordTokenType.SUPER: Parser._super_expression,
+    KeywordTokenType.THIS: Parser._this_expression,
+    LiteralTokenType.IDENTIFIER: Parser._variable_expression,
+    SimpleTokenType.LEFT_PAREN: Parser._grouping_expression,
+}
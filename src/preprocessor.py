@@ -1,8 +1,10 @@
 import dataclasses
+import functools
 import pathlib
 import re
+import typing as t
 
-IMPORT_PATTERN = re.compile(r"import\s+(?P<module><\w+>|\"\w+.lox\")")
+IMPORT_PATTERN = re.compile(r"^[ \t]*(?P<stmt>import[ \t]+(?P<module><\w+>|\"\w+\.lox\"))", re.MULTILINE)
 HEADERS = pathlib.Path("src/headers")
 
 
@@ -12,6 +14,12 @@ __all__: tuple[str, ...] = (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _read_header(path: pathlib.Path) -> t.Optional[str]:
+    """Read an imported file once per process; returns None if it does not exist."""
+    return path.read_text() if path.exists() else None
+
+
 @dataclasses.dataclass
 class Import:
     path: pathlib.Path
@@ -29,23 +37,27 @@ class PreProcessor:
         self._resolve_imports()
 
     def _resolve_imports(self) -> None:
-        paths: set[pathlib.Path] = set()
-        lines = self._source.splitlines(keepends=True)
-        for n, line in enumerate(lines):
-            if line.strip() and (match := IMPORT_PATTERN.match(line.strip())):
-                module = match.group("module")
-                if module.startswith("<"):
-                    path = HEADERS / f"{module[1:-1]}.lox"
-                elif module.startswith('"'):
-                    path = pathlib.Path(module[1:-1])
-                else:
-                    raise ValueError(f"Invalid module {module!r}.")
-                if path in paths or not path.exists():
-                    continue
-                paths.add(path)
-                self._includes[path.as_posix()] = Import(path, n, match.start(), match.end(), module)
-        for module in self._includes.values():
-            text = module.path.read_text()
+        spans: list[tuple[int, int, str]] = []
+        for match in IMPORT_PATTERN.finditer(self._source):
+            module = match.group("module")
+            if module.startswith("<"):
+                path = HEADERS / f"{module[1:-1]}.lox"
+            else:
+                path = pathlib.Path(module[1:-1])
+            key = path.as_posix()
+            if _read_header(path) is None:
+                continue
+            spans.append((match.start("stmt"), match.end("stmt"), key))
+            if key in self._includes:
+                continue
+            line = self._source.count("\n", 0, match.start())
+            self._includes[key] = Import(path, line, match.start("stmt"), match.end("stmt"), module)
+        if not spans:
+            return
+        replacements: dict[str, str] = {}
+        for key, module in self._includes.items():
+            text = _read_header(module.path)
+            assert text is not None
             self.lines += text.count("\n")
             if (
                 module.module.startswith("<")
@@ -54,7 +66,15 @@ class PreProcessor:
             ):
                 text += f"\nvar {module.module[1:-1]} = {module.module[1:-1]}();"
                 self.lines += 1
-            self._source = self._source.replace(f"import {module.module}", text)
+            replacements[key] = text
+        parts: list[str] = []
+        position = 0
+        for start, end, key in spans:
+            parts.append(self._source[position:start])
+            parts.append(replacements[key])
+            position = end
+        parts.append(self._source[position:])
+        self._source = "".join(parts)
 
     @property
     def includes(self) -> dict[str, Import]:
@@ -1,9 +1,10 @@
 import dataclasses
+import typing as t
 
 __all__: tuple[str, ...] = ("Cursor",)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Cursor:
     """
     A cursor for tracking the current position in the source code.
@@ -14,15 +15,21 @@ class Cursor:
     line: int = 1
     column: int = 1
     source: str = ""
+    _length: int = dataclasses.field(default=0, init=False, repr=False)
+    _line_starts: t.Optional[list[int]] = dataclasses.field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._length = len(self.source)
 
     def advance(self) -> str:
         """
         Advance the cursor by one character.
         :return: The character at the current position.
         """
-        self.current += 1
+        current = self.current
+        self.current = current + 1
         self.column += 1
-        return self.source[self.current - 1]
+        return self.source[current]
 
     def bump_line(self) -> None:
         self.line += 1
@@ -34,11 +41,10 @@ class Cursor:
         :param expected: The expected character.
         :return: True if the current character matches the expected character, False otherwise.
         """
-        if self.at_end:
-            return False
-        if self.source[self.current] != expected:
+        current = self.current
+        if current >= self._length or self.source[current] != expected:
             return False
-        self.current += 1
+        self.current = current + 1
         self.column += 1
         return True
 
@@ -48,7 +54,7 @@ class Cursor:
         :param offset: The offset from the current position.
         :return: The character at the current position.
         """
-        if self.current + offset >= len(self.source):
+        if self.current + offset >= self._length:
             return "\0"
         return self.source[self.current + offset]
 
@@ -59,7 +65,16 @@ class Cursor:
         :return: The error message with the source code.
         """
         error = f"Error on line {self.line} at column {self.column}:\n"
-        c_line = self.source.splitlines()[self.line - 1]
+        starts = self._line_starts
+        if starts is None:
+            starts = self._line_starts = [0]
+            index = self.source.find("\n")
+            while index != -1:
+                starts.append(index + 1)
+                index = self.source.find("\n", index + 1)
+        begin = starts[self.line - 1]
+        end = starts[self.line] - 1 if self.line < len(starts) else self._length
+        c_line = self.source[begin:end]
         return f"{error}\n{c_line}\n{'~' * (self.column - 1)}^\n{message}"
 
     @property
@@ -68,4 +83,4 @@ class Cursor:
         Check if the cursor is at the end of the source code.
         :return: True if the cursor is at the end of the source code, False otherwise.
         """
-        return self.current >= len(self.source)
+        return self.current >= self._length
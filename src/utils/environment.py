@@ -1,4 +1,3 @@
-import dataclasses
 import typing as t
 
 from src.exceptions import PyLoxRuntimeError
@@ -10,10 +9,16 @@ if t.TYPE_CHECKING:
 __all__: tuple[str, ...] = ("Environment",)
 
 
-@dataclasses.dataclass
+_SENTINEL: t.Any = object()
+
+
 class Environment:
-    enclosing: t.Optional["Environment"] = None
-    values: t.Dict[str, t.Any] = dataclasses.field(default_factory=dict)
+    __slots__ = ("enclosing", "values", "_ancestors")
+
+    def __init__(self, enclosing: t.Optional["Environment"] = None) -> None:
+        self.enclosing = enclosing
+        self.values: t.Dict[str, t.Any] = {}
+        self._ancestors: list["Environment"] = [self] if enclosing is None else [self, *enclosing._ancestors]
 
     def define(self, name: "Token", value: t.Any, /) -> None:
         """Define a variable in the environment."""
@@ -21,13 +26,14 @@ class Environment:
 
     def assign(self, name: "Token", value: t.Any, /) -> None:
         """Assign a variable in the environment."""
-        if name.lexeme in self.values:
-            self.values[name.lexeme] = value
-            return
-        if self.enclosing:
-            self.enclosing.assign(name, value)
-            return
-        raise PyLoxRuntimeError(f"Undefined variable '{name.lexeme}'.")
+        lexeme = name.lexeme
+        environment: t.Optional["Environment"] = self
+        while environment is not None:
+            if lexeme in environment.values:
+                environment.values[lexeme] = value
+                return
+            environment = environment.enclosing
+        raise PyLoxRuntimeError(f"Undefined variable '{lexeme}'.")
 
     def assign_at(self, distance: int, name: "Token", value: t.Any, /) -> None:
         """Assign a variable in the environment at a given distance."""
@@ -35,22 +41,19 @@ class Environment:
 
     def get(self, name: "Token", /) -> t.Any:
         """Get a variable from the environment."""
-        if name.lexeme in self.values:
-            return self.values[name.lexeme]
-        if self.enclosing:
-            return self.enclosing.get(name)
-        raise PyLoxRuntimeError(f"Undefined variable '{name.lexeme}'.")
+        lexeme = name.lexeme
+        environment: t.Optional["Environment"] = self
+        while environment is not None:
+            value = environment.values.get(lexeme, _SENTINEL)
+            if value is not _SENTINEL:
+                return value
+            environment = environment.enclosing
+        raise PyLoxRuntimeError(f"Undefined variable '{lexeme}'.")
 
-    def get_at(self, distance: int, name: t.Union[str, "Token"], /) -> t.Any:
+    def get_at(self, distance: int, name: str, /) -> t.Any:
         """Get a variable from the environment at a given distance."""
-        if isinstance(name, str):
-            return self.ancestor(distance).values[name]
-        return self.ancestor(distance).values[name.lexeme]
+        return self.ancestor(distance).values[name]
 
     def ancestor(self, distance: int, /) -> "Environment":
         """Get the ancestor of the environment at a given distance."""
-        environment: "Environment" = self
-        for _ in range(distance):
-            assert environment.enclosing is not None
-            environment = environment.enclosing
-        return environment
+        return self._ancestors[distance]
@@ -1,6 +1,7 @@
+from __future__ import annotations
+
 import dataclasses
 import typing as t
-from abc import ABC, abstractmethod
 
 from .protocol import StmtProtocol, VisitorProtocol
 
@@ -42,42 +43,46 @@ __all__: tuple[str, ...] = (
 )
 
 
-class Expr(ABC):
+class Expr:
     """Base class for expressions."""
 
-    @abstractmethod
+    __slots__: tuple[str, ...] = ()
+
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         raise NotImplementedError
 
 
-class Stmt(ABC):
+class Stmt:
     """Base class for statements."""
 
-    @abstractmethod
+    __slots__: tuple[str, ...] = ()
+
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
         """Accept a visitor."""
         raise NotImplementedError
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Assign(Expr):
     """An assignment expression."""
 
-    token: "Token"
+    token: Token
     value: Expr
+    _depth: int = dataclasses.field(default=-1, init=False, repr=False, compare=False)
+    """Scope distance filled in by the resolver; -1 means global."""
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_assign_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Binary(Expr):
     """A binary expression."""
 
     left: Expr
-    operator: "Token"
+    operator: Token
     right: Expr
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
@@ -85,32 +90,34 @@ class Binary(Expr):
         return visitor.visit_binary_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Call(Expr):
     """A call expression."""
 
     callee: Expr
-    paren: "Token"
-    arguments: t.Sequence[Expr]
+    paren: Token
+    arguments: tuple[Expr, ...]
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_call_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Get(Expr):
     """A get expression."""
 
     object: Expr
-    name: "Token"
+    name: Token
+    _cache: t.Any = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Monomorphic (class, method) cache filled in by the interpreter."""
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_get_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Grouping(Expr):
     """A grouping expression."""
 
@@ -121,7 +128,7 @@ class Grouping(Expr):
         return visitor.visit_grouping_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Literal(Expr):
     """A literal expression."""
 
@@ -132,12 +139,12 @@ class Literal(Expr):
         return visitor.visit_literal_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Logical(Expr):
     """A logical expression."""
 
     left: Expr
-    operator: "Token"
+    operator: Token
     right: Expr
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
@@ -145,12 +152,12 @@ class Logical(Expr):
         return visitor.visit_logical_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Set(Expr):
     """A set expression."""
 
     object: Expr
-    name: "Token"
+    name: Token
     value: Expr
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
@@ -158,34 +165,40 @@ class Set(Expr):
         return visitor.visit_set_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Super(Expr):
     """A super expression."""
 
-    keyword: "Token"
-    method: "Token"
+    keyword: Token
+    method: Token
+    _depth: int = dataclasses.field(default=-1, init=False, repr=False, compare=False)
+    """Scope distance filled in by the resolver; -1 means global."""
+    _resolved: t.Any = dataclasses.field(default=None, init=False, repr=False, compare=False)
+    """Cached (superclass, method) pair filled in by the interpreter."""
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_super_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class This(Expr):
     """A this expression."""
 
-    keyword: "Token"
+    keyword: Token
+    _depth: int = dataclasses.field(default=-1, init=False, repr=False, compare=False)
+    """Scope distance filled in by the resolver; -1 means global."""
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_this_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Unary(Expr):
     """A unary expression."""
 
-    operator: "Token"
+    operator: Token
     right: Expr
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
@@ -193,18 +206,20 @@ class Unary(Expr):
         return visitor.visit_unary_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Variable(Expr):
     """A variable expression."""
 
-    name: "Token"
+    name: Token
+    _depth: int = dataclasses.field(default=-1, init=False, repr=False, compare=False)
+    """Scope distance filled in by the resolver; -1 means global."""
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_variable_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Block(Stmt):
     """A block expression."""
 
@@ -215,42 +230,42 @@ class Block(Stmt):
         return visitor.visit_block_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Break(Stmt):
     """A break statement."""
 
-    keyword: "Token"
+    keyword: Token
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_break_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Class(Stmt):
     """A class expression."""
 
-    name: "Token"
+    name: Token
     superclass: t.Optional[Variable]
-    methods: list["Function"]
+    methods: list[Function]
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_class_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Continue(Stmt):
     """A continue statement."""
 
-    keyword: "Token"
+    keyword: Token
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
         """Accept a visitor."""
         return visitor.visit_continue_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Expression(Stmt):
     """An expression statement."""
 
@@ -261,7 +276,7 @@ class Expression(Stmt):
         return visitor.visit_expression_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class For(Stmt):
     """A for statement."""
 
@@ -275,12 +290,12 @@ class For(Stmt):
         return visitor.visit_for_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Function(Stmt):
     """A function expression."""
 
-    name: "Token"
-    params: list["Token"]
+    name: Token
+    params: tuple[Token, ...]
     body: list[Stmt]
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
@@ -288,7 +303,7 @@ class Function(Stmt):
         return visitor.visit_function_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class If(Stmt):
     """An if expression."""
 
@@ -301,11 +316,11 @@ class If(Stmt):
         return visitor.visit_if_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Lambda(Expr):
     """A lambda expression."""
 
-    params: list["Token"]
+    params: tuple[Token, ...]
     body: list[Stmt]
 
     def accept(self, visitor: VisitorProtocol, /) -> t.Any:
@@ -313,7 +328,7 @@ class Lambda(Expr):
         return visitor.visit_lambda_expr(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Print(Stmt):
     """A print statement."""
 
@@ -324,11 +339,11 @@ class Print(Stmt):
         return visitor.visit_print_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Return(Stmt):
     """A return statement."""
 
-    keyword: "Token"
+    keyword: Token
     value: t.Optional[Expr]
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
@@ -336,11 +351,11 @@ class Return(Stmt):
         return visitor.visit_return_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Throw(Stmt):
     """A throw statement."""
 
-    keyword: "Token"
+    keyword: Token
     value: Expr
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
@@ -348,11 +363,11 @@ class Throw(Stmt):
         return visitor.visit_throw_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Var(Stmt):
     """A variable expression."""
 
-    name: "Token"
+    name: Token
     initializer: t.Optional[Expr]
 
     def accept(self, visitor: StmtProtocol, /) -> t.Any:
@@ -360,7 +375,7 @@ class Var(Stmt):
         return visitor.visit_var_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class While(Stmt):
     """A while statement."""
 
@@ -373,11 +388,11 @@ class While(Stmt):
         return visitor.visit_while_stmt(self)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(slots=True, eq=False)
 class Try(Stmt):
     """A try statement."""
 
-    error: t.Optional["Token"]
+    error: t.Optional[Token]
     try_block: Stmt
     catch_block: t.Optional[Stmt]
     finally_block: t.Optional[Stmt]
@@ -1,5 +1,6 @@
+from __future__ import annotations
+
 import typing as t
-from abc import abstractmethod
 
 if t.TYPE_CHECKING:
     from src.utils.expr import (
@@ -33,116 +34,120 @@ if t.TYPE_CHECKING:
     )
 
 
-__all__: tuple[str, ...] = ("VisitorProtocol", "StmtProtocol")
+__all__: tuple[str, ...] = ("VisitorProtocol", "StmtProtocol", "VisitorBase")
+
+
+class VisitorBase:
+    """Builds a per-class dispatch table over the AST node types.
+
+    Subclasses get a ``_DISPATCH`` mapping of node type to unbound
+    ``visit_*`` method, computed once at class creation; instances bind
+    it with :meth:`_bind_dispatch` so call sites can do
+    ``dispatch[type(node)](node)`` without any attribute lookup.
+    """
+
+    _DISPATCH: t.ClassVar[dict[type, t.Callable[..., t.Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: t.Any) -> None:
+        super().__init_subclass__(**kwargs)
+        from src.utils import expr as nodes
+
+        dispatch: dict[type, t.Callable[..., t.Any]] = {}
+        for name in nodes.__all__:
+            node_type = getattr(nodes, name)
+            if node_type is nodes.Expr or node_type is nodes.Stmt:
+                continue
+            suffix = "expr" if issubclass(node_type, nodes.Expr) else "stmt"
+            method = getattr(cls, f"visit_{node_type.__name__.lower()}_{suffix}", None)
+            if method is not None:
+                dispatch[node_type] = method
+        cls._DISPATCH = dispatch
+
+    def _bind_dispatch(self) -> dict[type, t.Callable[[t.Any], t.Any]]:
+        """Bind the class-level table to this instance."""
+        return {node_type: method.__get__(self) for node_type, method in self._DISPATCH.items()}
 
 
 class VisitorProtocol(t.Protocol):
-    @abstractmethod
-    def visit_binary_expr(self, expr: "Binary") -> t.Any:
+    def visit_binary_expr(self, expr: Binary) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_grouping_expr(self, expr: "Grouping") -> t.Any:
+    def visit_grouping_expr(self, expr: Grouping) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_literal_expr(self, expr: "Literal") -> t.Any:
+    def visit_literal_expr(self, expr: Literal) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_unary_expr(self, expr: "Unary") -> t.Any:
+    def visit_unary_expr(self, expr: Unary) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_variable_expr(self, expr: "Variable") -> t.Any:
+    def visit_variable_expr(self, expr: Variable) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_assign_expr(self, expr: "Assign") -> t.Any:
+    def visit_assign_expr(self, expr: Assign) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_call_expr(self, expr: "Call") -> t.Any:
+    def visit_call_expr(self, expr: Call) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_get_expr(self, expr: "Get") -> t.Any:
+    def visit_get_expr(self, expr: Get) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_logical_expr(self, expr: "Logical") -> t.Any:
+    def visit_logical_expr(self, expr: Logical) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_set_expr(self, expr: "Set") -> t.Any:
+    def visit_set_expr(self, expr: Set) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_this_expr(self, expr: "This") -> t.Any:
+    def visit_this_expr(self, expr: This) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_super_expr(self, expr: "Super") -> t.Any:
+    def visit_super_expr(self, expr: Super) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_lambda_expr(self, expr: "Lambda") -> t.Any:
+    def visit_lambda_expr(self, expr: Lambda) -> t.Any:
         ...
 
 
 class StmtProtocol(t.Protocol):
-    @abstractmethod
-    def visit_block_stmt(self, stmt: "Block") -> t.Any:
+    def visit_block_stmt(self, stmt: Block) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_break_stmt(self, stmt: "Break") -> t.Any:
+    def visit_break_stmt(self, stmt: Break) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_expression_stmt(self, stmt: "Expression") -> t.Any:
+    def visit_expression_stmt(self, stmt: Expression) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_function_stmt(self, stmt: "Function") -> t.Any:
+    def visit_function_stmt(self, stmt: Function) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_if_stmt(self, stmt: "If") -> t.Any:
+    def visit_if_stmt(self, stmt: If) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_print_stmt(self, stmt: "Print") -> t.Any:
+    def visit_print_stmt(self, stmt: Print) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_return_stmt(self, stmt: "Return") -> t.Any:
+    def visit_return_stmt(self, stmt: Return) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_var_stmt(self, stmt: "Var") -> t.Any:
+    def visit_var_stmt(self, stmt: Var) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_while_stmt(self, stmt: "While") -> t.Any:
+    def visit_while_stmt(self, stmt: While) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_class_stmt(self, stmt: "Class") -> t.Any:
+    def visit_class_stmt(self, stmt: Class) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_continue_stmt(self, stmt: "Continue") -> t.Any:
+    def visit_continue_stmt(self, stmt: Continue) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_for_stmt(self, stmt: "For") -> t.Any:
+    def visit_for_stmt(self, stmt: For) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_throw_stmt(self, stmt: "Throw") -> t.Any:
+    def visit_throw_stmt(self, stmt: Throw) -> t.Any:
         ...
 
-    @abstractmethod
-    def visit_try_stmt(self, stmt: "Try") -> t.Any:
+    def visit_try_stmt(self, stmt: Try) -> t.Any:
         ...